@@ -0,0 +1,157 @@
+"""
+Load-test check_status() against the local API simulator.
+
+Every scenario serves a synthetic run from simulator.py in a separate
+process, so the CPU time measured here is the gate's alone, and runs the
+real gate against it over HTTP. Reported per scenario: wall time, number of
+polls (first-page requests for the job list), requests seen by the
+simulator and how many of them were 304s, CPU time per poll and the peak
+memory of decoding one full snapshot.
+
+Usage:
+    python3 benchmark.py [--sizes 10 100 1000] [--sources jobs check-runs] [--json]
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import sys
+import time
+import tracemalloc
+import urllib.request
+
+import check_status
+import simulator
+from github_api import GitHubClient
+
+
+def _serve(connection, job_count, duration, latency_seconds, error_rate):
+    run = simulator.Simulator(
+        simulator.synthetic_jobs(job_count, duration),
+        latency_seconds=latency_seconds,
+        error_rate=error_rate,
+    )
+    connection.send(run.api_url)
+    run.serve_forever()
+
+
+@contextlib.contextmanager
+def simulated_run(job_count, duration, latency_seconds=0, error_rate=0):
+    """Serve a synthetic run from a child process and yield its API URL."""
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_serve, args=(sender, job_count, duration, latency_seconds, error_rate), daemon=True
+    )
+    process.start()
+    try:
+        yield receiver.recv()
+    finally:
+        process.terminate()
+        process.join()
+
+
+def fetch_counters(api_url):
+    # Bypass any configured proxy; the simulator only listens on localhost.
+    opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+    with opener.open(f"{api_url}/_simulator/stats") as response:
+        return json.load(response)
+
+
+def measure_poll_memory(api_url, job_source):
+    """Return the peak bytes allocated by one cold poll, downloading and decoding every page."""
+    shared_client = check_status.api_client
+    check_status.api_client = GitHubClient(projections=check_status.API_PROJECTIONS)
+    try:
+        source = check_status.get_job_source_class(job_source)(simulator.REPO, simulator.RUN_ID, "benchmark", api_url)
+        tracemalloc.start()
+        try:
+            source.poll()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    finally:
+        check_status.api_client.close()
+        check_status.api_client = shared_client
+
+
+def run_scenario(job_count, job_source, duration=4.0, poll_interval_seconds=1, latency_seconds=0, error_rate=0):
+    """Run the gate against a synthetic run of ``job_count`` jobs and return its measurements."""
+    with simulated_run(job_count, duration, latency_seconds, error_rate) as api_url:
+        summary = {}
+        output = io.StringIO()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            passed = check_status.check_status(
+                github_token="benchmark",
+                repo=simulator.REPO,
+                run_id=simulator.RUN_ID,
+                initial_wait_seconds=1,
+                poll_interval_seconds=poll_interval_seconds,
+                timeout_minutes=5,
+                job_source=job_source,
+                api_url=api_url,
+                summary=summary,
+            )
+        wall_seconds = time.perf_counter() - wall_start
+        cpu_seconds = time.process_time() - cpu_start
+        counters = fetch_counters(api_url)
+        peak_bytes = measure_poll_memory(api_url, job_source)
+
+    polls = max(counters["polls"], 1)
+    return {
+        "jobs": job_count,
+        "source": job_source,
+        "result": summary.get("result", "success" if passed else "failure"),
+        "wall_seconds": round(wall_seconds, 3),
+        "polls": counters["polls"],
+        "requests": counters["requests"],
+        "not_modified": counters["not_modified"],
+        "bytes_downloaded": summary["api"]["bytes_downloaded"],
+        "cpu_ms_per_poll": round(cpu_seconds * 1000 / polls, 3),
+        "peak_kib_per_poll": round(peak_bytes / 1024, 1),
+    }
+
+
+def format_table(results):
+    columns = ("jobs", "source", "result", "wall_seconds", "polls", "requests", "not_modified",
+               "cpu_ms_per_poll", "peak_kib_per_poll")
+    lines = ["|" + "|".join(columns) + "|", "|" + "|".join("---" for _ in columns) + "|"]
+    for result in results:
+        lines.append("|" + "|".join(str(result[column]) for column in columns) + "|")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark check_status() against a simulated GitHub API.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Job counts to simulate.")
+    parser.add_argument("--sources", nargs="+", choices=tuple(check_status.JOB_SOURCES), default=list(check_status.JOB_SOURCES))
+    parser.add_argument("--duration", type=float, default=4.0, help="Seconds until the last job concludes.")
+    parser.add_argument("--poll-interval-seconds", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0, help="Seconds the simulator delays every response.")
+    parser.add_argument("--error-rate", type=float, default=0, help="Fraction of requests answered with a 502.")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    args = parser.parse_args(argv)
+
+    results = []
+    for job_count in args.sizes:
+        for job_source in args.sources:
+            results.append(run_scenario(
+                job_count,
+                job_source,
+                duration=args.duration,
+                poll_interval_seconds=args.poll_interval_seconds,
+                latency_seconds=args.latency,
+                error_rate=args.error_rate,
+            ))
+            if not args.json:
+                print(f"{job_count} job(s) via {job_source}: {results[-1]['wall_seconds']}s", file=sys.stderr)
+
+    print(json.dumps(results, indent=2) if args.json else format_table(results))
+    sys.exit(0 if all(result["result"] == "success" for result in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
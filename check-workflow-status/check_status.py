@@ -1,9 +1,40 @@
+import http.client
 import os
 import sys
-import time
-import urllib.request
-import json
-import fnmatch
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from clock import SystemClock
+from gate_report import build_summary, write_github_outputs
+from github_api import ApiError, GitHubClient, is_transient
+from job_matcher import JobMatcher
+from job_tracker import JobTracker, job_key
+from poll_scheduler import make_scheduler
+from timeline import TimelineWriter
+
+API_URL = "https://api.github.com"
+
+# The jobs API caps page size at 100; anything larger silently falls back to 30.
+JOBS_PER_PAGE = 100
+MAX_PAGE_WORKERS = 4
+
+# The only job and check run fields the gate reads; everything else (runner labels,
+# URLs, step timings) is dropped while a page is being decoded.
+JOB_FIELDS = ("id", "name", "status", "conclusion", "created_at", "started_at", "completed_at")
+STEP_FIELDS = ("name", "status", "conclusion", "number")
+CHECK_RUN_FIELDS = ("id", "name", "status", "conclusion", "started_at", "completed_at")
+
+API_PROJECTIONS = {
+    "jobs": dict.fromkeys(JOB_FIELDS) | {"steps": STEP_FIELDS},
+    "check_runs": CHECK_RUN_FIELDS,
+}
+
+# Shared by every request of the process so connections and conditional-request state
+# survive between polls.
+api_client = GitHubClient(projections=API_PROJECTIONS)
+
+# Last merged snapshot per list URL, reused while none of its pages changed.
+_merged_pages = {}
 
 
 def get_env(name, required=True, default=None):
@@ -13,13 +44,178 @@ def get_env(name, required=True, default=None):
     return value
 
 def fetch_json(url, token):
-    req = urllib.request.Request(url)
-    req.add_header("Authorization", f"Bearer {token}")
-    req.add_header("Accept", "application/vnd.github+json")
-    with urllib.request.urlopen(req) as resp:
-        if resp.status != 200:
-            raise RuntimeError(f"Failed to fetch {url} (HTTP {resp.status})\nResponse: {resp.read().decode()}")
-        return json.load(resp)
+    return api_client.get_json(url, token)
+
+def with_query(url, **params):
+    """Return url with the given query parameters added or replaced."""
+    parts = urllib.parse.urlsplit(url)
+    query = dict(urllib.parse.parse_qsl(parts.query))
+    query.update({key: str(value) for key, value in params.items()})
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+
+def fetch_list(list_url, token, key):
+    """
+    Fetch every page of a list endpoint and merge the ``key`` items into one snapshot.
+
+    When the first page reports ``total_count`` the remaining pages are fetched
+    concurrently; otherwise ``rel="next"`` links are followed one by one.
+    """
+    first_url = with_query(list_url, per_page=JOBS_PER_PAGE)
+    first = fetch_json(first_url, token)
+    pages = [first]
+
+    total_count = first.get("total_count")
+    if isinstance(total_count, int) and total_count > len(first.get(key, [])):
+        page_count = -(-total_count // JOBS_PER_PAGE)
+        page_urls = [with_query(first_url, page=page) for page in range(2, page_count + 1)]
+        if page_urls:
+            with ThreadPoolExecutor(max_workers=min(len(page_urls), MAX_PAGE_WORKERS)) as pool:
+                pages.extend(pool.map(lambda page_url: fetch_json(page_url, token), page_urls))
+    elif total_count is None:
+        seen = {first_url}
+        next_url = api_client.links(first_url).get("next")
+        while next_url and next_url not in seen:
+            seen.add(next_url)
+            pages.append(fetch_json(next_url, token))
+            next_url = api_client.links(next_url).get("next")
+
+    # Unchanged pages come back as the very same objects; so does the merged snapshot.
+    previous = _merged_pages.get(first_url)
+    if previous and len(previous[0]) == len(pages) and all(a is b for a, b in zip(previous[0], pages)):
+        return previous[1]
+
+    # Items can shift between pages while they are being fetched; keep the first copy of each.
+    items = []
+    seen_ids = set()
+    for page in pages:
+        for item in page.get(key, []):
+            item_id = item.get("id")
+            if item_id is not None:
+                if item_id in seen_ids:
+                    continue
+                seen_ids.add(item_id)
+            items.append(item)
+    snapshot = {"total_count": len(items), key: items}
+    _merged_pages[first_url] = (pages, snapshot)
+    return snapshot
+
+def fetch_jobs(jobs_api_url, token):
+    """Fetch every page of a workflow run's jobs and merge them into one snapshot."""
+    return fetch_list(jobs_api_url, token, "jobs")
+
+
+class JobsApiSource:
+    """Job source backed by the workflow run's jobs endpoint."""
+
+    name = "jobs"
+
+    def __init__(self, repo, run_id, token, api_url=API_URL):
+        self.url = f"{api_url}/repos/{repo}/actions/runs/{run_id}/jobs"
+        self.token = token
+
+    def poll(self):
+        """Return the current ``{"jobs": [...]}`` snapshot of the run."""
+        return fetch_jobs(self.url, self.token)
+
+
+class CheckRunsSource:
+    """
+    Job source backed by the check runs of the workflow run's check suite.
+
+    Every job of a run is reported as a check run with the job's name. The
+    listing uses ``filter=latest`` so re-run attempts replace earlier ones,
+    and only check runs whose status or timestamps changed since the last
+    poll are converted again; the rest of the snapshot is carried over.
+    Requires the ``checks: read`` permission.
+    """
+
+    name = "check-runs"
+    FIELDS = CHECK_RUN_FIELDS
+    CHANGE_FIELDS = ("status", "conclusion", "started_at", "completed_at")
+
+    def __init__(self, repo, run_id, token, api_url=API_URL):
+        self.repo = repo
+        self.api_url = api_url
+        self.run_url = f"{api_url}/repos/{repo}/actions/runs/{run_id}"
+        self.token = token
+        self.check_runs_url = None
+        self._jobs = {}
+        self._last_response = None
+        self._snapshot = {"total_count": 0, "jobs": []}
+
+    def poll(self):
+        """Return the current ``{"jobs": [...]}`` snapshot of the run."""
+        if self.check_runs_url is None:
+            run = fetch_json(self.run_url, self.token)
+            self.check_runs_url = with_query(
+                f"{self.api_url}/repos/{self.repo}/check-suites/{run['check_suite_id']}/check-runs",
+                filter="latest",
+            )
+
+        response = fetch_list(self.check_runs_url, self.token, "check_runs")
+        if response is self._last_response:
+            return self._snapshot
+        self._last_response = response
+
+        changed = False
+        jobs = {}
+        for check_run in response.get("check_runs", []):
+            job = self._jobs.get(check_run["id"])
+            if job is None or any(job[field] != check_run.get(field) for field in self.CHANGE_FIELDS):
+                job = {field: check_run.get(field) for field in self.FIELDS}
+                changed = True
+            jobs[check_run["id"]] = job
+        if changed or jobs.keys() != self._jobs.keys():
+            self._jobs = jobs
+            self._snapshot = {"total_count": len(jobs), "jobs": list(jobs.values())}
+        return self._snapshot
+
+
+JOB_SOURCES = {source.name: source for source in (JobsApiSource, CheckRunsSource)}
+
+
+def get_job_source_class(name):
+    """Return the job source class for a ``job-source`` input value."""
+    if name not in JOB_SOURCES:
+        raise ValueError(f"Unknown job source: '{name}' (expected one of {', '.join(JOB_SOURCES)})")
+    return JOB_SOURCES[name]
+
+
+def judge_conclusion(label, conclusion, skipped_jobs_succeed):
+    """Apply the gate's rules to a concluded job and return ``(passed, message)``."""
+    if conclusion == "success":
+        return True, f"✓ Job '{label}' completed successfully."
+    if conclusion == "skipped":
+        if skipped_jobs_succeed:
+            return True, f"✓ Job '{label}' was skipped (treated as success)."
+        return False, f"✗ Job '{label}' was skipped (treated as failure)."
+    if conclusion in ("failure", "cancelled"):
+        return False, f"✗ Job '{label}' {conclusion}."
+    return False, f"✗ Job '{label}' has unexpected conclusion: {conclusion}."
+
+
+def failed_step(job):
+    """Return the first step of a job that concluded with ``failure``, or ``None``."""
+    for step in job.get("steps") or ():
+        if step.get("conclusion") == "failure":
+            return step
+    return None
+
+
+def find_step_failure(tracker, jobs):
+    """
+    Return the fail-fast message for the first pending job of a snapshot with a failed step.
+
+    Steps can fail while their job's status is unchanged, so the whole snapshot
+    is scanned rather than the tracker's transitions.
+    """
+    for job in jobs:
+        key = job_key(job)
+        if key in tracker.pending:
+            step = failed_step(job)
+            if step is not None:
+                return f"✗ Job '{tracker.label(key)}' failed at step '{step['name']}' (failing fast)."
+    return None
 
 
 def check_status(
@@ -32,47 +228,214 @@ def check_status(
     skipped_jobs_succeed=True,
     poll_interval_seconds=5,
     current_job_name="check-workflow-status",
+    poll_strategy="fixed",
+    initial_wait_stable_polls=0,
+    job_source="jobs",
+    included_jobs="",
+    excluded_jobs_regex="",
+    included_jobs_regex="",
+    summary=None,
+    fail_fast_on_step_failure=False,
+    api_url=API_URL,
+    clock=None,
+    capture_path=None,
 ):
-    start_time = time.time()
+    """
+    Wait for the jobs of a workflow run and return whether they all passed.
+
+    When a ``summary`` dict is given it is filled with the machine-readable
+    summary of the run (see gate_report.build_summary). With
+    ``fail_fast_on_step_failure`` the gate fails as soon as a step of a
+    monitored job fails, without waiting for the job to conclude; this needs
+    step data, so it has no effect with the check-runs job source.
+
+    ``job_source`` is the name of a job source or an object with a ``poll()``
+    method returning a ``{"jobs": [...]}`` snapshot. ``clock`` provides
+    ``time()`` and ``sleep()`` (a SystemClock by default), also to the API
+    client's retries and circuit breaker; together with a SimulatedClock and
+    a scripted source, a run can be replayed without waiting in real time.
+
+    With a ``capture_path`` every distinct snapshot the gate polls is written
+    to that timeline file (see timeline.py) for offline replay with replay.py.
+    """
+    clock = clock or SystemClock()
+    stats_before = api_client.stats.copy()
+    report = {"tracker": None, "waited_seconds": 0.0, "start_time": clock.time(), "capture": None}
+    passed = False
+    # Retry backoff and circuit-breaker waits follow the gate's clock too.
+    previous_clock, api_client.clock = api_client.clock, clock
+    try:
+        if capture_path:
+            report["capture"] = TimelineWriter(
+                capture_path,
+                repo=repo,
+                run_id=run_id,
+                job_source=job_source if isinstance(job_source, str) else getattr(job_source, "name", None),
+                current_job_name=current_job_name,
+                started_at=report["start_time"],
+            )
+        passed = _check_status(
+            report=report,
+            github_token=github_token,
+            repo=repo,
+            run_id=run_id,
+            excluded_jobs=excluded_jobs,
+            timeout_minutes=timeout_minutes,
+            initial_wait_seconds=initial_wait_seconds,
+            skipped_jobs_succeed=skipped_jobs_succeed,
+            poll_interval_seconds=poll_interval_seconds,
+            current_job_name=current_job_name,
+            poll_strategy=poll_strategy,
+            initial_wait_stable_polls=initial_wait_stable_polls,
+            job_source=job_source,
+            included_jobs=included_jobs,
+            excluded_jobs_regex=excluded_jobs_regex,
+            included_jobs_regex=included_jobs_regex,
+            fail_fast_on_step_failure=fail_fast_on_step_failure,
+            api_url=api_url,
+            clock=clock,
+        )
+        return passed
+    finally:
+        api_client.clock = previous_clock
+        if report["capture"] is not None:
+            report["capture"].close()
+        stats = api_client.stats.since(stats_before)
+        print(
+            f"API usage: {stats.requests} request(s) over {stats.connections} connection(s), "
+            f"{stats.not_modified} not modified (HTTP 304), {stats.retries} retried, "
+            f"circuit opened {stats.circuit_opens} time(s), {stats.bytes_downloaded} bytes downloaded."
+        )
+        if summary is not None:
+            tracker = report["tracker"]
+            summary.update(build_summary(
+                passed,
+                tracker.jobs.values() if tracker else [],
+                stats,
+                report["waited_seconds"],
+                clock.time() - report["start_time"],
+            ))
+
+
+def _check_status(
+    report,
+    github_token,
+    repo,
+    run_id,
+    excluded_jobs,
+    timeout_minutes,
+    initial_wait_seconds,
+    skipped_jobs_succeed,
+    poll_interval_seconds,
+    current_job_name,
+    poll_strategy,
+    initial_wait_stable_polls,
+    job_source,
+    included_jobs,
+    excluded_jobs_regex,
+    included_jobs_regex,
+    fail_fast_on_step_failure,
+    api_url,
+    clock,
+):
+    scheduler = make_scheduler(poll_strategy)
+    if isinstance(job_source, str):
+        source = get_job_source_class(job_source)(repo, run_id, github_token, api_url)
+    else:
+        source = job_source
+    start_time = report["start_time"]
     timeout_seconds = timeout_minutes * 60
+    deadline = start_time + timeout_seconds
+
+    matcher = JobMatcher(excluded_jobs, included_jobs, excluded_jobs_regex, included_jobs_regex)
+
+    def is_monitored(job_name):
+        return job_name != current_job_name and matcher.is_monitored(job_name)
+
+    if matcher.excluded_patterns:
+        print(f"Excluding jobs matching patterns: {matcher.excluded_patterns}")
+    if matcher.excluded_regex:
+        print(f"Excluding jobs matching regex: {matcher.excluded_regex}")
+    if matcher.included_patterns:
+        print(f"Only monitoring jobs matching patterns: {matcher.included_patterns}")
+    if matcher.included_regex:
+        print(f"Only monitoring jobs matching regex: {matcher.included_regex}")
 
-    # Parse excluded job patterns
-    excluded_patterns = [p.strip() for p in excluded_jobs.split(",") if p.strip()]
+    def fetch_snapshot():
+        """
+        Fetch the jobs and return them with the number of rate-limited requests it took.
 
-    def is_excluded(job_name):
-        """Check if a job name matches any excluded pattern."""
-        return any(fnmatch.fnmatch(job_name, pattern) for pattern in excluded_patterns)
+        While the API is down the response is ``None``: the poll had no new
+        data, and the next one waits behind the client's circuit breaker.
+        """
+        before = api_client.stats.copy()
+        try:
+            response = source.poll()
+        except (ApiError, OSError, http.client.HTTPException) as e:
+            if not is_transient(e):
+                raise
+            print(f"⚠️ Polling jobs failed: {str(e).splitlines()[0]}; polling again.", file=sys.stderr)
+            response = None
+        polled = api_client.stats.since(before)
+        if report["capture"] is not None and response is not None:
+            report["capture"].record(clock.time() - start_time, response)
+        return response, polled.requests - polled.not_modified
 
-    if excluded_patterns:
-        print(f"Excluding jobs matching patterns: {excluded_patterns}")
+    def wait(interval, changed, jobs, requests_per_poll, until=None):
+        """Sleep until the next poll as decided by the poll scheduler."""
+        now = clock.time()
+        delay = scheduler.next_delay(
+            interval,
+            now,
+            min(deadline, until) if until is not None else deadline,
+            changed=changed,
+            jobs=jobs,
+            rate_limit=api_client.rate_limit,
+            requests_per_poll=requests_per_poll,
+        )
+        report["waited_seconds"] += delay
+        clock.sleep(delay)
 
-    # Phase 1: Wait the full initial wait period for jobs to appear
-    jobs_api_url = f"https://api.github.com/repos/{repo}/actions/runs/{run_id}/jobs"
+    # Phase 1: Wait the initial wait period for jobs to appear, or until the job set has settled
     print(f"Waiting {initial_wait_seconds}s for all jobs to appear (excluding current job: '{current_job_name}')...")
+    if initial_wait_stable_polls:
+        print(f"Ending the initial wait early once the job set is unchanged for {initial_wait_stable_polls} poll(s).")
 
     initial_wait_end = start_time + initial_wait_seconds
     other_jobs_found = False
     all_jobs = []
     other_jobs = []
+    job_names = None
+    stable_polls = 0
 
     # Always fetch jobs at least once, then continue polling until initial_wait_seconds
     while True:
-        if time.time() - start_time > timeout_seconds:
+        if clock.time() >= deadline:
             print(f"Overall timeout of {timeout_minutes} minutes exceeded.", file=sys.stderr)
             return False
 
-        jobs_response = fetch_json(jobs_api_url, github_token)
+        jobs_response, requests_per_poll = fetch_snapshot()
+        if jobs_response is None:
+            # No jobs seen is not the same as no jobs: keep waiting for a successful poll.
+            wait(1, False, other_jobs, requests_per_poll)
+            continue
         all_jobs = jobs_response.get("jobs", [])
-        other_jobs = [j for j in all_jobs if j["name"] != current_job_name and not is_excluded(j["name"])]
+        other_jobs = [j for j in all_jobs if is_monitored(j["name"])]
 
         if other_jobs:
             other_jobs_found = True
 
+        previous_names, job_names = job_names, sorted(j["name"] for j in all_jobs)
+        stable_polls = stable_polls + 1 if other_jobs and job_names == previous_names else 0
+        if initial_wait_stable_polls and stable_polls >= initial_wait_stable_polls:
+            print(f"Job set unchanged for {stable_polls} poll(s); ending initial wait early.")
+            break
+
         # Check if we've waited long enough
-        if time.time() >= initial_wait_end:
+        if clock.time() >= initial_wait_end:
             break
 
-        time.sleep(1)
+        wait(1, stable_polls == 0, other_jobs, requests_per_poll, until=initial_wait_end)
 
     if not other_jobs_found:
         print(f"No jobs found after {initial_wait_seconds}s initial wait period.", file=sys.stderr)
@@ -84,65 +447,58 @@ def check_status(
     print(f"Initial wait complete. Found {len(other_jobs)} job(s) to monitor.")
 
     # Phase 2: Monitor all jobs until completion or timeout
-    print(f"Monitoring jobs (polling every {poll_interval_seconds}s, timeout: {timeout_minutes} minutes)...")
-    discovered_jobs = set()
-    completed_jobs = {}
+    if poll_strategy == "adaptive":
+        print(f"Monitoring jobs (adaptive polling from every {poll_interval_seconds}s, timeout: {timeout_minutes} minutes)...")
+    else:
+        print(f"Monitoring jobs (polling every {poll_interval_seconds}s, timeout: {timeout_minutes} minutes)...")
+    tracker = report["tracker"] = JobTracker(is_monitored)
+    last_response = None
 
     while True:
-        elapsed = time.time() - start_time
-        if elapsed > timeout_seconds:
+        elapsed = clock.time() - start_time
+        if elapsed >= timeout_seconds:
             print(f"Overall timeout of {timeout_minutes} minutes exceeded.", file=sys.stderr)
-            print(f"Completed jobs: {len(completed_jobs)}/{len(discovered_jobs)}", file=sys.stderr)
-            incomplete = discovered_jobs - set(completed_jobs.keys())
-            if incomplete:
-                print(f"Incomplete jobs: {sorted(incomplete)}", file=sys.stderr)
+            print(f"Completed jobs: {tracker.completed}/{len(tracker.jobs)}", file=sys.stderr)
+            if tracker.pending:
+                print(f"Incomplete jobs: {tracker.pending_labels()}", file=sys.stderr)
             return False
 
-        jobs_response = fetch_json(jobs_api_url, github_token)
-        all_jobs = jobs_response.get("jobs", [])
-        other_jobs = [j for j in all_jobs if j["name"] != current_job_name and not is_excluded(j["name"])]
-
-        # Track all discovered jobs
-        for job in other_jobs:
-            job_name = job["name"]
-            if job_name not in discovered_jobs:
-                discovered_jobs.add(job_name)
-                print(f"Discovered job: '{job_name}'")
-
-        # Check completion status
-        for job in other_jobs:
-            job_name = job["name"]
-            conclusion = job.get("conclusion")
-
-            if conclusion is not None and job_name not in completed_jobs:
-                completed_jobs[job_name] = conclusion
-
-                if conclusion == "success":
-                    print(f"✓ Job '{job_name}' completed successfully.")
-                elif conclusion == "skipped":
-                    if skipped_jobs_succeed:
-                        print(f"✓ Job '{job_name}' was skipped (treated as success).")
-                    else:
-                        print(f"✗ Job '{job_name}' was skipped (treated as failure).", file=sys.stderr)
-                        return False
-                elif conclusion in ("failure", "cancelled"):
-                    print(f"✗ Job '{job_name}' {conclusion}.", file=sys.stderr)
-                    return False
-                else:
-                    print(f"✗ Job '{job_name}' has unexpected conclusion: {conclusion}.", file=sys.stderr)
-                    return False
+        jobs_response, requests_per_poll = fetch_snapshot()
+        if jobs_response is None or jobs_response is last_response:
+            # Failed, or not modified since the last poll, so neither is its outcome.
+            wait(poll_interval_seconds, False, tracker.jobs.values(), requests_per_poll)
+            continue
+        last_response = jobs_response
+
+        transitions = tracker.apply(jobs_response.get("jobs", []))
+        for event, key, job in transitions:
+            label = tracker.label(key)
+            if event == "discovered":
+                print(f"Discovered job: '{label}'")
+            if event != "completed":
+                continue
+
+            passed, message = judge_conclusion(label, job["conclusion"], skipped_jobs_succeed)
+            print(message, file=sys.stdout if passed else sys.stderr)
+            if not passed:
+                return False
+
+        if fail_fast_on_step_failure:
+            message = find_step_failure(tracker, jobs_response.get("jobs", []))
+            if message:
+                print(message, file=sys.stderr)
+                return False
 
         # Check if all discovered jobs are complete
-        if len(completed_jobs) == len(discovered_jobs) and len(discovered_jobs) > 0:
-            print(f"All {len(discovered_jobs)} job(s) completed successfully in {elapsed:.1f}s.")
+        if tracker.done:
+            print(f"All {len(tracker.jobs)} job(s) completed successfully in {elapsed:.1f}s.")
             return True
 
-        # Show progress
-        in_progress = discovered_jobs - set(completed_jobs.keys())
-        if in_progress:
-            print(f"In progress ({len(completed_jobs)}/{len(discovered_jobs)} complete): {sorted(in_progress)}")
+        # Show progress, only when something changed
+        if transitions:
+            print(f"In progress ({tracker.completed}/{len(tracker.jobs)} complete): {tracker.pending_labels()}")
 
-        time.sleep(poll_interval_seconds)
+        wait(poll_interval_seconds, bool(transitions), tracker.jobs.values(), requests_per_poll)
 
 def main():
     try:
@@ -153,6 +509,9 @@ def main():
 
         # Parse optional configuration (with defaults in check_status function)
         kwargs = {}
+        if get_env("GITHUB_API_URL", required=False):
+            # Set by the runner; differs from the default on GitHub Enterprise Server.
+            kwargs["api_url"] = get_env("GITHUB_API_URL", required=False).rstrip("/")
         if get_env("INPUT_TIMEOUT_MINUTES", required=False):
             kwargs["timeout_minutes"] = int(get_env("INPUT_TIMEOUT_MINUTES", required=False))
         if get_env("INPUT_INITIAL_WAIT_SECONDS", required=False):
@@ -163,17 +522,44 @@ def main():
             kwargs["poll_interval_seconds"] = int(get_env("INPUT_POLL_INTERVAL_SECONDS", required=False))
         if get_env("INPUT_EXCLUDED_JOBS", required=False):
             kwargs["excluded_jobs"] = get_env("INPUT_EXCLUDED_JOBS", required=False)
+        if get_env("INPUT_INITIAL_WAIT_STABLE_POLLS", required=False):
+            kwargs["initial_wait_stable_polls"] = int(get_env("INPUT_INITIAL_WAIT_STABLE_POLLS", required=False))
+        if get_env("INPUT_INCLUDED_JOBS", required=False):
+            kwargs["included_jobs"] = get_env("INPUT_INCLUDED_JOBS", required=False)
+        if get_env("INPUT_EXCLUDED_JOBS_REGEX", required=False):
+            kwargs["excluded_jobs_regex"] = get_env("INPUT_EXCLUDED_JOBS_REGEX", required=False)
+        if get_env("INPUT_INCLUDED_JOBS_REGEX", required=False):
+            kwargs["included_jobs_regex"] = get_env("INPUT_INCLUDED_JOBS_REGEX", required=False)
+        if get_env("INPUT_JOB_SOURCE", required=False):
+            kwargs["job_source"] = get_env("INPUT_JOB_SOURCE", required=False).lower()
+            # Reject an unknown job source before the gate starts polling.
+            get_job_source_class(kwargs["job_source"])
+        if get_env("INPUT_POLL_STRATEGY", required=False):
+            kwargs["poll_strategy"] = get_env("INPUT_POLL_STRATEGY", required=False).lower()
+            # Reject an unknown strategy before the gate starts polling.
+            make_scheduler(kwargs["poll_strategy"])
+        if get_env("INPUT_CAPTURE_PATH", required=False):
+            kwargs["capture_path"] = get_env("INPUT_CAPTURE_PATH", required=False)
+        if get_env("INPUT_FAIL_FAST_ON_STEP_FAILURE", required=False):
+            kwargs["fail_fast_on_step_failure"] = get_env("INPUT_FAIL_FAST_ON_STEP_FAILURE", required=False).lower() == "true"
     except Exception as e:
         print(str(e), file=sys.stderr)
         sys.exit(1)
 
+    summary = {}
     result = check_status(
         github_token=github_token,
         repo=repo,
         run_id=run_id,
         current_job_name=current_job_name,
+        summary=summary,
         **kwargs
     )
+    write_github_outputs(
+        summary,
+        output_path=get_env("GITHUB_OUTPUT", required=False),
+        step_summary_path=get_env("GITHUB_STEP_SUMMARY", required=False),
+    )
     sys.exit(0 if result else 1)
 
 if __name__ == "__main__":
@@ -0,0 +1,33 @@
+import time
+
+
+class SystemClock:
+    """Wall-clock time and real sleeps."""
+
+    def time(self):
+        # Looked up on every call so patches of time.time/time.sleep keep applying.
+        return time.time()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+
+class SimulatedClock:
+    """
+    Deterministic clock for simulating the gate.
+
+    Time only moves when the gate sleeps, so a scenario spanning hours runs
+    as fast as the gate can evaluate its polls. ``sleeps`` records every
+    requested delay.
+    """
+
+    def __init__(self, start=0.0):
+        self.now = start
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += max(seconds, 0)
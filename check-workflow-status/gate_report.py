@@ -0,0 +1,83 @@
+import json
+
+from poll_scheduler import parse_timestamp
+
+
+def job_timing(job):
+    """Return the timing fields of a job, with queue and run time in seconds."""
+    created = parse_timestamp(job.get("created_at"))
+    started = parse_timestamp(job.get("started_at"))
+    completed = parse_timestamp(job.get("completed_at"))
+    return {
+        "name": job["name"],
+        "id": job.get("id"),
+        "status": job.get("status"),
+        "conclusion": job.get("conclusion"),
+        "started_at": job.get("started_at"),
+        "completed_at": job.get("completed_at"),
+        "queue_seconds": round(started - created, 3) if created is not None and started is not None else None,
+        "duration_seconds": round(completed - started, 3) if started is not None and completed is not None else None,
+    }
+
+
+def build_summary(passed, jobs, stats, waited_seconds, elapsed_seconds):
+    """Build the machine-readable summary of a gate run."""
+    return {
+        "result": "success" if passed else "failure",
+        "elapsed_seconds": round(elapsed_seconds, 3),
+        "waited_seconds": round(waited_seconds, 3),
+        "api": {
+            "requests": stats.requests,
+            "not_modified": stats.not_modified,
+            "connections": stats.connections,
+            "bytes_downloaded": stats.bytes_downloaded,
+            "retries": stats.retries,
+            "circuit_opens": stats.circuit_opens,
+        },
+        "jobs": [job_timing(job) for job in jobs],
+    }
+
+
+def format_step_summary(summary):
+    """Render a summary as markdown, slowest jobs first to surface the critical path."""
+    icon = "✅" if summary["result"] == "success" else "❌"
+    api = summary["api"]
+    lines = [
+        f"### {icon} Check Workflow Status: {summary['result']}",
+        "",
+        f"Finished in {summary['elapsed_seconds']:.1f}s ({summary['waited_seconds']:.1f}s waiting between polls) "
+        f"using {api['requests']} API request(s), {api['not_modified']} not modified, {api['retries']} retried, "
+        f"{api['bytes_downloaded']} bytes downloaded.",
+        "",
+    ]
+    if summary["jobs"]:
+        lines += ["|Job|Conclusion|Queued (s)|Duration (s)|", "|---|---|---|---|"]
+        jobs = sorted(summary["jobs"], key=lambda job: job["duration_seconds"] or 0, reverse=True)
+        for job in jobs:
+            queued = "" if job["queue_seconds"] is None else f"{job['queue_seconds']:.0f}"
+            duration = "" if job["duration_seconds"] is None else f"{job['duration_seconds']:.0f}"
+            name = job["name"].replace("|", "\\|")
+            lines.append(f"|{name}|{job['conclusion'] or job['status'] or ''}|{queued}|{duration}|")
+        lines.append("")
+    lines += [
+        "<details><summary>JSON</summary>",
+        "",
+        "```json",
+        json.dumps(summary, indent=2),
+        "```",
+        "",
+        "</details>",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def write_github_outputs(summary, output_path=None, step_summary_path=None):
+    """Append the summary to the ``GITHUB_OUTPUT`` and ``GITHUB_STEP_SUMMARY`` files, when set."""
+    if output_path:
+        with open(output_path, "a", encoding="utf-8") as f:
+            f.write(f"result={summary['result']}\n")
+            f.write(f"summary={json.dumps(summary, separators=(',', ':'))}\n")
+    if step_summary_path:
+        with open(step_summary_path, "a", encoding="utf-8") as f:
+            f.write(format_step_summary(summary))
@@ -0,0 +1,387 @@
+import base64
+import email.utils
+import http.client
+import random
+import sys
+import threading
+import urllib.parse
+import urllib.request
+
+from clock import SystemClock
+from json_projection import ProjectingDecoder
+
+USER_AGENT = "eidp-check-workflow-status"
+REQUEST_TIMEOUT_SECONDS = 30
+MAX_REDIRECTS = 5
+
+# Transient failures are retried with capped exponential backoff and jitter.
+MAX_ATTEMPTS = 5
+BACKOFF_BASE_SECONDS = 1
+BACKOFF_MAX_SECONDS = 30
+# Give up instead of honouring a Retry-After (or rate-limit reset) further away than this.
+MAX_RETRY_WAIT_SECONDS = 120
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+# Consecutive failed requests after which the client pauses all requests for a cooldown.
+# Below MAX_ATTEMPTS, so a single request that keeps failing already waits behind the circuit.
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_COOLDOWN_SECONDS = 30
+
+# Raised when the server drops a keep-alive connection between two requests.
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class ApiError(RuntimeError):
+    """An API request that completed with an unexpected HTTP status."""
+
+    def __init__(self, url, status, headers, body):
+        super().__init__(f"Failed to fetch {url} (HTTP {status})\nResponse: {body.decode(errors='replace')}")
+        self.url = url
+        self.status = status
+        self.headers = headers
+
+
+def parse_link_header(value):
+    """Parse an RFC 8288 Link header into a mapping of rel to URL."""
+    links = {}
+    for part in (value or "").split(","):
+        section = part.split(";")
+        url = section[0].strip()
+        if not (url.startswith("<") and url.endswith(">")):
+            continue
+        for param in section[1:]:
+            key, _, rel = param.strip().partition("=")
+            if key.strip() == "rel":
+                for name in rel.strip('"').split():
+                    links[name] = url[1:-1]
+    return links
+
+
+def parse_retry_after(value, now):
+    """Return the epoch time a ``Retry-After`` header (seconds or HTTP date) points to."""
+    if not value:
+        return None
+    try:
+        return now + max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def resolve_proxy(scheme, netloc):
+    """
+    Return the proxy URL (split) to use for a host, or ``None`` to connect directly.
+
+    Follows the same ``HTTPS_PROXY``/``HTTP_PROXY``/``NO_PROXY`` environment
+    variables urllib honours.
+    """
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(netloc.rsplit(":", 1)[0]):
+        return None
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    return urllib.parse.urlsplit(proxy)
+
+
+def is_retryable(status, headers):
+    """Whether a response status is a transient failure worth retrying."""
+    if status in RETRYABLE_STATUSES:
+        return True
+    # Secondary rate limits and an exhausted primary quota are reported as 403.
+    return status == 403 and bool(headers.get("Retry-After") or headers.get("X-RateLimit-Remaining") == "0")
+
+
+def is_transient(error):
+    """Whether a request error is an outage (network, 5xx, rate limit) rather than a wrong request."""
+    if isinstance(error, ApiError):
+        return is_retryable(error.status, error.headers)
+    return isinstance(error, (OSError, http.client.HTTPException))
+
+
+def backoff_delay(attempt, rng, base=BACKOFF_BASE_SECONDS, maximum=BACKOFF_MAX_SECONDS):
+    """Return the jittered delay before retry number ``attempt`` (0-based): half fixed, half random."""
+    ceiling = min(maximum, base * 2 ** attempt)
+    return ceiling / 2 + rng.uniform(0, ceiling / 2)
+
+
+class ApiStats:
+    """Counters describing the traffic a client has sent to the API."""
+
+    FIELDS = ("requests", "not_modified", "connections", "bytes_downloaded", "retries", "circuit_opens")
+
+    def __init__(self, **values):
+        for field in self.FIELDS:
+            setattr(self, field, values.get(field, 0))
+
+    def copy(self):
+        return ApiStats(**{field: getattr(self, field) for field in self.FIELDS})
+
+    def since(self, earlier):
+        """Return the counters accumulated after the ``earlier`` copy was taken."""
+        return ApiStats(**{field: getattr(self, field) - getattr(earlier, field) for field in self.FIELDS})
+
+
+class CircuitBreaker:
+    """
+    Pauses requests after repeated consecutive failures.
+
+    Once ``failure_threshold`` requests in a row have failed the circuit
+    opens, and requests wait until ``cooldown_seconds`` have passed instead of
+    adding load to an API that is down. The next request then probes it: a
+    success closes the circuit, a failure opens it for another cooldown.
+    """
+
+    def __init__(self, failure_threshold=CIRCUIT_FAILURE_THRESHOLD, cooldown_seconds=CIRCUIT_COOLDOWN_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.failures = 0
+        self.open_until = None
+        self._lock = threading.Lock()
+
+    def wait_time(self, now):
+        """Seconds until requests may be sent again (``0`` while closed)."""
+        with self._lock:
+            return max(self.open_until - now, 0) if self.open_until is not None else 0
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.open_until = None
+
+    def record_failure(self, now):
+        """Count a failed request and return whether it opened the circuit."""
+        with self._lock:
+            self.failures += 1
+            if self.failures < self.failure_threshold:
+                return False
+            if self.open_until is not None and self.open_until > now:
+                return False
+            self.open_until = now + self.cooldown_seconds
+            return True
+
+
+class ConnectionPool:
+    """
+    Keep-alive HTTP(S) connections, reused across requests to the same host.
+
+    Connections are checked out for the duration of a single request, so the
+    pool can be shared by the threads that fetch job pages concurrently.
+    """
+
+    def __init__(self, max_idle_per_host=4, timeout=REQUEST_TIMEOUT_SECONDS):
+        self.max_idle_per_host = max_idle_per_host
+        self.timeout = timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, scheme, netloc):
+        """Return ``(connection, reused)`` for the given host."""
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            if idle:
+                return idle.pop(), True
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        proxy = resolve_proxy(scheme, netloc)
+        if proxy is None:
+            return connection_class(netloc, timeout=self.timeout), False
+
+        # Tunnel through the proxy with CONNECT, as urllib would for HTTPS_PROXY/HTTP_PROXY.
+        # A proxy URL without a port uses its own scheme's default port, not the target's.
+        proxy_port = proxy.port or (443 if proxy.scheme == "https" else 80)
+        connection = connection_class(proxy.hostname, proxy_port, timeout=self.timeout)
+        tunnel_headers = {}
+        if proxy.username is not None:
+            credentials = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+            tunnel_headers["Proxy-Authorization"] = f"Basic {base64.b64encode(credentials.encode()).decode()}"
+        connection.set_tunnel(netloc, headers=tunnel_headers)
+        return connection, False
+
+    def release(self, scheme, netloc, connection):
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+
+class GitHubClient:
+    """
+    GitHub REST client with keep-alive connections and a conditional-request cache.
+
+    The ETag, pagination links and decoded body of every successful response
+    are kept per URL. Later requests send ``If-None-Match`` and a ``304`` hands
+    back the previously decoded object as-is, so unchanged pages are neither
+    downloaded nor decoded again and do not count against the primary rate limit.
+
+    Network errors, 5xx responses and rate-limit rejections are retried up
+    to ``max_attempts`` times with jittered exponential backoff, waiting at
+    least as long as ``Retry-After`` asks. A circuit breaker shared by all
+    requests pauses them while the API keeps failing. These waits go through
+    ``clock`` (a SystemClock by default), which check_status() points at its
+    own clock for the duration of a run.
+    """
+
+    def __init__(self, pool=None, projections=None, max_attempts=MAX_ATTEMPTS, circuit_breaker=None, clock=None):
+        self.clock = clock or SystemClock()
+        self.stats = ApiStats()
+        self.max_attempts = max_attempts
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._random = random.Random()
+        # Successful bodies are decoded while they stream in, keeping only the projected fields.
+        self._decoder = ProjectingDecoder(projections or {})
+        # Primary quota and secondary-limit back-off, as reported by the most recent response.
+        self.rate_limit = {"remaining": None, "reset": None, "retry_at": None}
+        self._pool = pool or ConnectionPool()
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def close(self):
+        self._pool.close()
+
+    def links(self, url):
+        """Return the pagination links of the last response for url."""
+        entry = self._cache.get(url)
+        return entry["links"] if entry else {}
+
+    def get_json(self, url, token):
+        attempt = 0
+        while True:
+            wait = self.circuit_breaker.wait_time(self.clock.time())
+            if wait:
+                self.clock.sleep(wait)
+            try:
+                data = self._get_json(url, token)
+            except ApiError as e:
+                if not is_retryable(e.status, e.headers):
+                    # The API answered, so it is up; the request itself is wrong.
+                    self.circuit_breaker.record_success()
+                    raise
+                error, reason = e, f"HTTP {e.status}"
+            except (OSError, http.client.HTTPException) as e:
+                error, reason = e, type(e).__name__
+            else:
+                self.circuit_breaker.record_success()
+                return data
+
+            now = self.clock.time()
+            opened = self.circuit_breaker.record_failure(now)
+            attempt += 1
+            delay = backoff_delay(attempt - 1, self._random)
+            retry_at = self.rate_limit["retry_at"] if isinstance(error, ApiError) else None
+            if retry_at is None and isinstance(error, ApiError) and self.rate_limit["remaining"] == 0:
+                retry_at = self.rate_limit["reset"]
+            if retry_at is not None:
+                delay = max(delay, retry_at - now)
+            with self._lock:
+                self.stats.circuit_opens += opened
+                if attempt >= self.max_attempts or delay > MAX_RETRY_WAIT_SECONDS:
+                    raise error
+                self.stats.retries += 1
+            print(f"Request to {url} failed ({reason}); retrying in {delay:.1f}s "
+                  f"(attempt {attempt + 1}/{self.max_attempts}).", file=sys.stderr)
+            self.clock.sleep(delay)
+
+    def _get_json(self, url, token):
+        cached = self._cache.get(url)
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "User-Agent": USER_AGENT,
+        }
+        if cached and cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+
+        status, response_headers, data = self._get(url, headers)
+        self._record_rate_limit(response_headers)
+        if status == 304 and cached:
+            with self._lock:
+                self.stats.not_modified += 1
+            return cached["data"]
+        if status != 200:
+            raise ApiError(url, status, response_headers, data)
+
+        self._cache[url] = {
+            "etag": response_headers.get("ETag"),
+            "links": parse_link_header(response_headers.get("Link")),
+            "data": data,
+        }
+        return data
+
+    def _record_rate_limit(self, headers):
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is not None and remaining.isdigit():
+            self.rate_limit["remaining"] = int(remaining)
+        if reset is not None and reset.isdigit():
+            self.rate_limit["reset"] = int(reset)
+        self.rate_limit["retry_at"] = parse_retry_after(headers.get("Retry-After"), self.clock.time())
+
+    def _get(self, url, headers):
+        """
+        Perform a GET, following redirects, and return ``(status, headers, body)``.
+
+        The body of a ``200`` is the decoded JSON; any other body is raw bytes.
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            status, response_headers, body = self._send(url, headers)
+            location = response_headers.get("Location")
+            if status not in (301, 302, 307, 308) or not location:
+                return status, response_headers, body
+            url = urllib.parse.urljoin(url, location)
+        raise ApiError(url, status, response_headers, body)
+
+    def _send(self, url, headers):
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+
+        while True:
+            connection, reused = self._pool.acquire(parts.scheme, parts.netloc)
+            with self._lock:
+                self.stats.requests += 1
+                if not reused:
+                    self.stats.connections += 1
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+                if response.status == 200:
+                    body, size = self._decoder.decode(response)
+                else:
+                    body = response.read()
+                    size = len(body)
+            except STALE_CONNECTION_ERRORS:
+                connection.close()
+                if reused:
+                    # The server closed the idle connection; retry on another one.
+                    with self._lock:
+                        self.stats.requests -= 1
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+
+            with self._lock:
+                self.stats.bytes_downloaded += size
+            if response.will_close:
+                connection.close()
+            else:
+                self._pool.release(parts.scheme, parts.netloc, connection)
+            return response.status, response.headers, body
@@ -0,0 +1,62 @@
+import fnmatch
+import re
+
+
+def split_patterns(value):
+    """Split a comma-separated input into its non-empty, stripped patterns."""
+    return [p.strip() for p in (value or "").split(",") if p.strip()]
+
+
+def compile_globs(globs):
+    """Combine glob patterns into a single regex, or ``None`` when there are none."""
+    if not globs:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(glob)})" for glob in globs))
+
+
+def compile_regex(pattern, input_name):
+    if not pattern:
+        return None
+    try:
+        return re.compile(pattern)
+    except re.error as e:
+        raise ValueError(f"Invalid regular expression in {input_name}: {e}") from e
+
+
+class JobMatcher:
+    """
+    Decides which jobs a gate monitors.
+
+    Glob patterns of each rule set are combined into one precompiled regex
+    (whole-name match); the regex inputs are searched for anywhere in the
+    name. A job is monitored when it matches the include rules (if any) and
+    none of the exclude rules. Verdicts are memoized per job name, so each
+    distinct name is matched once per run rather than once per pattern per poll.
+    """
+
+    def __init__(self, excluded_jobs="", included_jobs="", excluded_jobs_regex="", included_jobs_regex=""):
+        self.excluded_patterns = split_patterns(excluded_jobs)
+        self.included_patterns = split_patterns(included_jobs)
+        self.excluded_regex = excluded_jobs_regex.strip()
+        self.included_regex = included_jobs_regex.strip()
+        self._excluded = compile_globs(self.excluded_patterns)
+        self._included = compile_globs(self.included_patterns)
+        self._excluded_re = compile_regex(self.excluded_regex, "excluded-jobs-regex")
+        self._included_re = compile_regex(self.included_regex, "included-jobs-regex")
+        self.has_includes = bool(self._included or self._included_re)
+        self._verdicts = {}
+
+    def is_monitored(self, job_name):
+        verdict = self._verdicts.get(job_name)
+        if verdict is None:
+            included = not self.has_includes or bool(
+                (self._included and self._included.match(job_name))
+                or (self._included_re and self._included_re.search(job_name))
+            )
+            excluded = bool(
+                (self._excluded and self._excluded.match(job_name))
+                or (self._excluded_re and self._excluded_re.search(job_name))
+            )
+            verdict = included and not excluded
+            self._verdicts[job_name] = verdict
+        return verdict
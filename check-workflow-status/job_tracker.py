@@ -0,0 +1,83 @@
+def job_key(job):
+    """Key a job by its id, or by its name when it has none."""
+    return job.get("id", job["name"])
+
+
+class JobTracker:
+    """
+    Incremental state of the jobs a gate monitors, keyed by job id.
+
+    Snapshots are applied as diffs: a job only costs work when its status or
+    conclusion differs from the previous snapshot, and the pending set and
+    conclusion counters are updated in place instead of being recomputed.
+    Jobs without an id (as returned by older fixtures) are keyed by name.
+    Matrix jobs sharing a name are tracked separately and labelled with
+    their id so log lines stay unambiguous.
+    """
+
+    def __init__(self, is_monitored):
+        self.is_monitored = is_monitored
+        self.jobs = {}
+        self.pending = set()
+        self.conclusions = {}
+        self.counts = {}
+        self._states = {}
+        self._ignored = set()
+        self._labels = {}
+        self._name_counts = {}
+
+    @property
+    def completed(self):
+        return len(self.conclusions)
+
+    @property
+    def done(self):
+        """Whether at least one job was discovered and every discovered job concluded."""
+        return bool(self.jobs) and not self.pending
+
+    def label(self, key):
+        return self._labels[key]
+
+    def pending_labels(self):
+        return sorted(self._labels[key] for key in self.pending)
+
+    def apply(self, jobs):
+        """
+        Apply a snapshot and return its transitions in snapshot order.
+
+        Each transition is ``(event, key, job)`` where event is ``"discovered"``,
+        ``"status"`` or ``"completed"``.
+        """
+        transitions = []
+        for job in jobs:
+            key = job_key(job)
+            state = (job.get("status"), job.get("conclusion"))
+            previous = self._states.get(key)
+            if previous == state or key in self._ignored:
+                continue
+
+            if previous is None:
+                if not self.is_monitored(job["name"]):
+                    self._ignored.add(key)
+                    continue
+                self._discover(key, job)
+                transitions.append(("discovered", key, job))
+            self._states[key] = state
+            self.jobs[key] = job
+
+            conclusion = state[1]
+            if conclusion is not None and key in self.pending:
+                self.pending.discard(key)
+                self.conclusions[key] = conclusion
+                self.counts[conclusion] = self.counts.get(conclusion, 0) + 1
+                transitions.append(("completed", key, job))
+            elif previous is not None:
+                transitions.append(("status", key, job))
+        return transitions
+
+    def _discover(self, key, job):
+        name = job["name"]
+        count = self._name_counts.get(name, 0) + 1
+        self._name_counts[name] = count
+        self._labels[key] = name if count == 1 or "id" not in job else f"{name} (id {job['id']})"
+        self.pending.add(key)
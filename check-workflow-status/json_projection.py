@@ -0,0 +1,171 @@
+import codecs
+import json
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = " \t\n\r"
+_RAW_DECODER = json.JSONDecoder()
+
+
+class ProjectingDecoder:
+    """
+    Incrementally decode a JSON object, projecting its large lists as they stream in.
+
+    ``projections`` maps a top-level key (e.g. ``"jobs"``) to the item fields
+    to keep. The items of those lists are decoded one at a time from a
+    bounded buffer and reduced to the listed fields right away, so a page's
+    ``steps`` arrays, runner labels and URLs never exist as Python objects all
+    at once. A field may map to a nested tuple of fields to project a list
+    of sub-objects, e.g. ``{"steps": ("name", "conclusion")}``. Other
+    top-level values are decoded as usual.
+    """
+
+    def __init__(self, projections):
+        self.projections = projections
+
+    def decode(self, stream):
+        """Decode a readable binary stream; return ``(data, bytes_read)``."""
+        return _Parser(self, stream).parse()
+
+    def decode_bytes(self, data):
+        return self.decode(_BytesStream(data))[0]
+
+
+def project(item, fields):
+    """Reduce a decoded object to ``fields`` (a sequence of names, or a dict for nested lists)."""
+    if not isinstance(item, dict):
+        return item
+    if isinstance(fields, dict):
+        projected = {}
+        for name, nested in fields.items():
+            if name not in item:
+                continue
+            value = item[name]
+            if nested and isinstance(value, list):
+                value = [project(sub_item, nested) for sub_item in value]
+            projected[name] = value
+        return projected
+    return {name: item[name] for name in fields if name in item}
+
+
+class _BytesStream:
+    def __init__(self, data):
+        self._data = data
+        self._pos = 0
+
+    def read(self, size):
+        chunk = self._data[self._pos:self._pos + size]
+        self._pos += len(chunk)
+        return chunk
+
+
+class _Parser:
+    def __init__(self, decoder, stream):
+        self.projections = decoder.projections
+        self.stream = stream
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.bytes_read = 0
+
+    def parse(self):
+        if self._peek() != "{":
+            # Only objects carry projected lists; decode anything else in one go.
+            while not self.eof:
+                self._fill()
+            return json.loads(self.buffer), self.bytes_read
+        self._expect("{")
+        data = {}
+        if self._peek() == "}":
+            self.pos += 1
+            return data, self._finish()
+        while True:
+            key = self._value()
+            self._expect(":")
+            fields = self.projections.get(key)
+            if fields is not None and self._peek() == "[":
+                data[key] = self._projected_list(fields)
+            else:
+                data[key] = self._value()
+            separator = self._next_char()
+            if separator == "}":
+                return data, self._finish()
+            if separator != ",":
+                self._error("Expected ',' or '}'")
+
+    def _projected_list(self, fields):
+        self._expect("[")
+        items = []
+        if self._peek() == "]":
+            self.pos += 1
+            return items
+        while True:
+            items.append(project(self._value(), fields))
+            separator = self._next_char()
+            if separator == "]":
+                return items
+            if separator != ",":
+                self._error("Expected ',' or ']'")
+
+    def _finish(self):
+        while not self.eof:
+            self._fill()
+        if self.buffer[self.pos:].strip(WHITESPACE):
+            self._error("Extra data")
+        return self.bytes_read
+
+    def _value(self):
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = _RAW_DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self._fill()
+                continue
+            # A number or literal running up to the end of the buffer may continue in the next chunk.
+            if end == len(self.buffer) and not self.eof:
+                self._fill()
+                continue
+            self.pos = end
+            self._compact()
+            return value
+
+    def _expect(self, char):
+        if self._next_char() != char:
+            self._error(f"Expected '{char}'")
+
+    def _next_char(self):
+        char = self._peek()
+        self.pos += 1
+        return char
+
+    def _peek(self):
+        self._skip_whitespace()
+        if self.pos >= len(self.buffer):
+            self._error("Unexpected end of data")
+        return self.buffer[self.pos]
+
+    def _skip_whitespace(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                return
+            self._fill()
+
+    def _fill(self):
+        chunk = self.stream.read(CHUNK_SIZE)
+        self.bytes_read += len(chunk)
+        self.eof = not chunk
+        self.buffer += self.text_decoder.decode(chunk, final=self.eof)
+
+    def _compact(self):
+        # Drop consumed text once it outweighs a chunk, keeping the buffer bounded.
+        if self.pos > CHUNK_SIZE:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+
+    def _error(self, message):
+        raise json.JSONDecodeError(message, self.buffer, self.pos)
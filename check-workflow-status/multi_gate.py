@@ -0,0 +1,209 @@
+"""
+Wait on several workflow runs at once, in one process.
+
+Every run is polled by its own coroutine; the blocking API calls run in
+worker threads and share check_status's client, so all runs reuse the same
+keep-alive connections and conditional-request cache. A semaphore bounds
+the number of polls in flight and an optional budget caps the total number
+of API requests across all runs. Each run is judged with the same success,
+skip and failure rules as check_status().
+
+Usage:
+    GITHUB_TOKEN=... python3 multi_gate.py owner/repo:RUN_ID [owner/repo:RUN_ID ...]
+"""
+import argparse
+import asyncio
+import http.client
+import sys
+import time
+
+import check_status
+from github_api import ApiError
+from job_matcher import JobMatcher
+from job_tracker import JobTracker
+from poll_scheduler import make_scheduler
+
+
+class RunResult:
+    """Outcome of waiting on a single workflow run."""
+
+    def __init__(self, repo, run_id, success, reason, jobs=0, completed=0):
+        self.repo = repo
+        self.run_id = run_id
+        self.success = success
+        self.reason = reason
+        self.jobs = jobs
+        self.completed = completed
+
+    def __repr__(self):
+        return f"RunResult({self.repo}#{self.run_id}, success={self.success}, reason={self.reason!r})"
+
+
+class RequestBudget:
+    """Caps the API requests made by all runs together (``None`` for no cap)."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self._start = check_status.api_client.stats.requests
+
+    @property
+    def used(self):
+        return check_status.api_client.stats.requests - self._start
+
+    @property
+    def exhausted(self):
+        return self.limit is not None and self.used >= self.limit
+
+
+def parse_target(value):
+    """Parse ``owner/repo:run_id`` into ``(repo, run_id)``."""
+    repo, _, run_id = value.rpartition(":")
+    if repo.count("/") != 1 or not run_id.isdigit():
+        raise ValueError(f"Invalid target '{value}' (expected owner/repo:run_id)")
+    return repo, run_id
+
+
+async def gate_run(
+    repo,
+    run_id,
+    github_token,
+    semaphore,
+    budget,
+    excluded_jobs="",
+    included_jobs="",
+    timeout_minutes=30,
+    initial_wait_seconds=10,
+    skipped_jobs_succeed=True,
+    poll_interval_seconds=5,
+    poll_strategy="fixed",
+    job_source="jobs",
+    current_job_name="",
+    fail_fast_on_step_failure=False,
+    api_url=check_status.API_URL,
+):
+    prefix = f"[{repo}#{run_id}]"
+    matcher = JobMatcher(excluded_jobs, included_jobs)
+    tracker = JobTracker(lambda name: name != current_job_name and matcher.is_monitored(name))
+    scheduler = make_scheduler(poll_strategy)
+    source = check_status.get_job_source_class(job_source)(repo, run_id, github_token, api_url)
+    start_time = time.time()
+    deadline = start_time + timeout_minutes * 60
+    initial_wait_end = start_time + initial_wait_seconds
+
+    def result(success, reason):
+        print(f"{prefix} {reason}", file=sys.stdout if success else sys.stderr)
+        return RunResult(repo, run_id, success, reason, len(tracker.jobs), tracker.completed)
+
+    last_response = None
+    while True:
+        if time.time() >= deadline:
+            return result(False, f"Overall timeout of {timeout_minutes} minutes exceeded "
+                                 f"({tracker.completed}/{len(tracker.jobs)} jobs complete).")
+        if budget.exhausted:
+            return result(False, f"Request budget of {budget.limit} exhausted.")
+
+        try:
+            async with semaphore:
+                response = await asyncio.to_thread(source.poll)
+        except (ApiError, OSError, http.client.HTTPException) as e:
+            # Only this run fails; the other runs keep polling and report their own result.
+            return result(False, str(e))
+
+        transitions = []
+        changed = response is not last_response
+        if changed:
+            last_response = response
+            transitions = tracker.apply(response.get("jobs", []))
+        for event, key, job in transitions:
+            if event != "completed":
+                continue
+            passed, message = check_status.judge_conclusion(tracker.label(key), job["conclusion"], skipped_jobs_succeed)
+            if not passed:
+                return result(False, message)
+        if fail_fast_on_step_failure and changed:
+            message = check_status.find_step_failure(tracker, response.get("jobs", []))
+            if message:
+                return result(False, message)
+
+        now = time.time()
+        in_initial_wait = now < initial_wait_end
+        if not in_initial_wait:
+            if not tracker.jobs:
+                return result(False, f"No jobs found after {initial_wait_seconds}s initial wait period.")
+            if tracker.done:
+                return result(True, f"All {len(tracker.jobs)} job(s) completed successfully in {now - start_time:.1f}s.")
+
+        delay = scheduler.next_delay(
+            1 if in_initial_wait else poll_interval_seconds,
+            now,
+            min(deadline, initial_wait_end) if in_initial_wait else deadline,
+            changed=bool(transitions),
+            jobs=tracker.jobs.values(),
+            rate_limit=check_status.api_client.rate_limit,
+        )
+        await asyncio.sleep(delay)
+
+
+async def gate_runs(targets, github_token, max_concurrency=8, request_budget=None, **options):
+    """
+    Wait on every ``(repo, run_id)`` target concurrently.
+
+    Returns one RunResult per target, in the order of ``targets``. Keyword
+    options are the check_status() settings that apply to each run.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    budget = RequestBudget(request_budget)
+    return await asyncio.gather(*(
+        gate_run(repo, run_id, github_token, semaphore, budget, **options) for repo, run_id in targets
+    ))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Wait for several workflow runs to complete.")
+    parser.add_argument("targets", nargs="+", metavar="owner/repo:run_id")
+    parser.add_argument("--excluded-jobs", default="")
+    parser.add_argument("--included-jobs", default="")
+    parser.add_argument("--timeout-minutes", type=int, default=30)
+    parser.add_argument("--initial-wait-seconds", type=int, default=10)
+    parser.add_argument("--skipped-jobs-fail", action="store_true", help="Treat skipped jobs as failures.")
+    parser.add_argument("--fail-fast-on-step-failure", action="store_true",
+                        help="Fail a run as soon as a step of a monitored job fails.")
+    parser.add_argument("--poll-interval-seconds", type=int, default=5)
+    parser.add_argument("--poll-strategy", choices=("fixed", "adaptive"), default="adaptive")
+    parser.add_argument("--job-source", choices=tuple(check_status.JOB_SOURCES), default="jobs")
+    parser.add_argument("--max-concurrency", type=int, default=8, help="Maximum polls in flight at once.")
+    parser.add_argument("--request-budget", type=int, default=None, help="Maximum API requests across all runs.")
+    args = parser.parse_args(argv)
+
+    try:
+        github_token = check_status.get_env("GITHUB_TOKEN")
+        api_url = check_status.get_env("GITHUB_API_URL", required=False, default=check_status.API_URL).rstrip("/")
+        targets = [parse_target(target) for target in args.targets]
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+
+    results = asyncio.run(gate_runs(
+        targets,
+        github_token,
+        max_concurrency=args.max_concurrency,
+        request_budget=args.request_budget,
+        excluded_jobs=args.excluded_jobs,
+        included_jobs=args.included_jobs,
+        timeout_minutes=args.timeout_minutes,
+        initial_wait_seconds=args.initial_wait_seconds,
+        skipped_jobs_succeed=not args.skipped_jobs_fail,
+        poll_interval_seconds=args.poll_interval_seconds,
+        fail_fast_on_step_failure=args.fail_fast_on_step_failure,
+        poll_strategy=args.poll_strategy,
+        job_source=args.job_source,
+        api_url=api_url,
+    ))
+
+    failed = [r for r in results if not r.success]
+    print(f"{len(results) - len(failed)}/{len(results)} run(s) succeeded.")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import statistics
+from datetime import datetime
+
+POLL_STRATEGIES = ("fixed", "adaptive")
+
+# Adaptive polling never waits less than this, nor longer than MAX_BACKOFF_FACTOR * interval.
+MIN_INTERVAL_SECONDS = 1
+MAX_BACKOFF_FACTOR = 8
+BACKOFF_MULTIPLIER = 2
+# Requests kept in reserve for other consumers of the same token.
+RATE_LIMIT_RESERVE = 50
+
+
+def parse_timestamp(value):
+    """Parse an API timestamp such as ``2024-01-01T12:00:00Z`` into epoch seconds."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def make_scheduler(strategy):
+    """Return the poll scheduler for a ``poll-strategy`` input value."""
+    if strategy == "fixed":
+        return FixedPollScheduler()
+    if strategy == "adaptive":
+        return AdaptivePollScheduler()
+    raise ValueError(f"Unknown poll strategy: '{strategy}' (expected one of {', '.join(POLL_STRATEGIES)})")
+
+
+class FixedPollScheduler:
+    """Wait the configured interval between polls, whatever happens."""
+
+    def next_delay(self, interval, now, deadline, changed=False, jobs=(), rate_limit=None, requests_per_poll=1):
+        return max(0, min(interval, deadline - now))
+
+
+class AdaptivePollScheduler:
+    """
+    Derive the wait before the next poll from job progress and the API quota.
+
+    - While no job changes state the interval doubles, up to
+      ``MAX_BACKOFF_FACTOR`` times the configured interval.
+    - In-progress jobs that are expected to finish sooner than that pull the
+      next poll forward; the expected duration is the median of the jobs that
+      already completed in this run.
+    - The remaining primary quota is spread evenly until it resets, and a
+      ``Retry-After`` from a secondary rate limit is always honoured.
+    - The wait never extends past the overall deadline.
+    """
+
+    def __init__(self):
+        self.unchanged_polls = 0
+
+    def next_delay(self, interval, now, deadline, changed=False, jobs=(), rate_limit=None, requests_per_poll=1):
+        if changed:
+            self.unchanged_polls = 0
+        elif BACKOFF_MULTIPLIER ** self.unchanged_polls < MAX_BACKOFF_FACTOR:
+            self.unchanged_polls += 1
+
+        delay = min(interval * BACKOFF_MULTIPLIER ** self.unchanged_polls, interval * MAX_BACKOFF_FACTOR)
+
+        remaining = self._shortest_expected_remaining(jobs, now)
+        if remaining is not None:
+            delay = min(delay, max(remaining, interval))
+        delay = max(delay, MIN_INTERVAL_SECONDS)
+
+        if rate_limit:
+            delay = max(delay, self._quota_delay(rate_limit, now, requests_per_poll))
+
+        return max(0, min(delay, deadline - now))
+
+    @staticmethod
+    def _shortest_expected_remaining(jobs, now):
+        durations = []
+        running_since = []
+        for job in jobs:
+            started = parse_timestamp(job.get("started_at"))
+            if started is None:
+                continue
+            if job.get("conclusion") is not None:
+                completed = parse_timestamp(job.get("completed_at"))
+                if completed is not None and completed >= started:
+                    durations.append(completed - started)
+            elif job.get("status") == "in_progress":
+                running_since.append(started)
+        if not durations or not running_since:
+            return None
+        expected = statistics.median(durations)
+        return max(0, min(expected - (now - started) for started in running_since))
+
+    @staticmethod
+    def _quota_delay(rate_limit, now, requests_per_poll):
+        delay = 0
+        retry_at = rate_limit.get("retry_at")
+        if retry_at is not None:
+            delay = max(delay, retry_at - now)
+        remaining = rate_limit.get("remaining")
+        reset = rate_limit.get("reset")
+        if remaining is not None and reset is not None and reset > now:
+            polls_left = max(remaining - RATE_LIMIT_RESERVE, 0) / max(requests_per_poll, 1)
+            delay = max(delay, (reset - now) / polls_left if polls_left >= 1 else reset - now)
+        return delay
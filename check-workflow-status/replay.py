@@ -0,0 +1,160 @@
+"""
+Replay captured job timelines through the gate under different settings.
+
+A timeline recorded with the ``capture-path`` input is fed back through
+check_status() on a simulated clock, once per combination of settings, so
+a grid of poll intervals, initial waits and exclusions over many captures
+runs in seconds. For each combination it reports the decisions, the API
+requests the gate would have made (one per page of jobs per poll, 304s
+included) and the decision latency: how long after the start of the
+capture the gate reached its verdict.
+
+Captured snapshots are those the original gate polled, so the replayed
+job states are only as fine-grained as the captured run's poll interval.
+
+Usage:
+    python3 replay.py capture.ndjson.gz [more captures ...] \\
+        --poll-interval-seconds 5 15 30 --initial-wait-seconds 10 30 --excluded-jobs "" "deploy-*"
+"""
+import argparse
+import bisect
+import contextlib
+import io
+import itertools
+import json
+import math
+import sys
+
+import check_status
+from clock import SimulatedClock
+from timeline import read_timeline
+
+
+class ReplaySource:
+    """
+    Job source serving a captured timeline on a simulated clock.
+
+    Each poll returns the last snapshot captured at or before the replayed
+    time, as the same object while it is unchanged, like a 304 would.
+    ``requests`` counts the requests a real poll would have sent.
+    """
+
+    name = "replay"
+
+    def __init__(self, header, entries, clock):
+        self.job_source = header.get("job_source") or "jobs"
+        self.times = [t for t, _ in entries]
+        self.snapshots = [{"total_count": len(jobs), "jobs": jobs} for _, jobs in entries]
+        self.clock = clock
+        self.start_time = clock.time()
+        self.empty = {"total_count": 0, "jobs": []}
+        self.polls = 0
+        self.requests = 0
+        self.not_modified = 0
+        self._last = None
+
+    def poll(self):
+        index = bisect.bisect_right(self.times, self.clock.time() - self.start_time) - 1
+        snapshot = self.snapshots[index] if index >= 0 else self.empty
+        pages = max(math.ceil(len(snapshot["jobs"]) / check_status.JOBS_PER_PAGE), 1)
+        if self.polls == 0 and self.job_source == "check-runs":
+            # The check-runs source looks up the run's check suite once.
+            self.requests += 1
+        self.polls += 1
+        self.requests += pages
+        if snapshot is self._last:
+            self.not_modified += pages
+        self._last = snapshot
+        return snapshot
+
+
+def replay(path, **settings):
+    """Replay one captured timeline with check_status() ``settings`` and return the outcome."""
+    header, entries = read_timeline(path)
+    clock = SimulatedClock(start=header.get("started_at") or 0)
+    source = ReplaySource(header, entries, clock)
+    settings.setdefault("current_job_name", header.get("current_job_name") or "")
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        passed = check_status.check_status(
+            github_token="replay",
+            repo=header.get("repo"),
+            run_id=header.get("run_id"),
+            job_source=source,
+            clock=clock,
+            **settings
+        )
+    return {
+        "capture": str(path),
+        "result": "success" if passed else "failure",
+        "decision_seconds": round(clock.now - source.start_time, 3),
+        "polls": source.polls,
+        "requests": source.requests,
+        "not_modified": source.not_modified,
+    }
+
+
+def replay_grid(paths, grid):
+    """
+    Replay every capture under every combination of the ``grid`` settings.
+
+    ``grid`` maps a check_status() keyword to the values to try. Returns one
+    aggregate per combination, in grid order, each listing its runs.
+    """
+    names = list(grid)
+    aggregates = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        settings = dict(zip(names, values))
+        runs = [replay(path, **settings) for path in paths]
+        decisions = [run["decision_seconds"] for run in runs]
+        aggregates.append({
+            "settings": settings,
+            "runs": runs,
+            "failures": sum(run["result"] == "failure" for run in runs),
+            "requests": sum(run["requests"] for run in runs),
+            "mean_decision_seconds": round(sum(decisions) / len(decisions), 3) if decisions else None,
+            "max_decision_seconds": max(decisions, default=None),
+        })
+    return aggregates
+
+
+def format_table(aggregates):
+    names = list(aggregates[0]["settings"]) if aggregates else []
+    columns = names + ["failures", "requests", "mean_decision_seconds", "max_decision_seconds"]
+    lines = ["|" + "|".join(columns) + "|", "|" + "|".join("---" for _ in columns) + "|"]
+    for aggregate in aggregates:
+        cells = [repr(aggregate["settings"][name]) for name in names]
+        cells += [str(aggregate[column]) for column in columns[len(names):]]
+        lines.append("|" + "|".join(cells) + "|")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay captured job timelines under different gate settings.")
+    parser.add_argument("captures", nargs="+", help="Timeline files written with the capture-path input.")
+    parser.add_argument("--poll-interval-seconds", type=int, nargs="+", default=[5])
+    parser.add_argument("--initial-wait-seconds", type=int, nargs="+", default=[10])
+    parser.add_argument("--initial-wait-stable-polls", type=int, nargs="+", default=[0])
+    parser.add_argument("--poll-strategy", nargs="+", choices=("fixed", "adaptive"), default=["fixed"])
+    parser.add_argument("--excluded-jobs", nargs="+", default=[""])
+    parser.add_argument("--timeout-minutes", type=int, default=30)
+    parser.add_argument("--json", action="store_true", help="Print every run as JSON instead of a table.")
+    args = parser.parse_args(argv)
+
+    grid = {
+        "poll_interval_seconds": args.poll_interval_seconds,
+        "initial_wait_seconds": args.initial_wait_seconds,
+        "initial_wait_stable_polls": args.initial_wait_stable_polls,
+        "poll_strategy": args.poll_strategy,
+        "excluded_jobs": args.excluded_jobs,
+        "timeout_minutes": [args.timeout_minutes],
+    }
+    try:
+        aggregates = replay_grid(args.captures, grid)
+    except (OSError, ValueError) as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+    print(json.dumps(aggregates, indent=2) if args.json else format_table(aggregates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""
+Local stand-in for the parts of the GitHub REST API the gate polls.
+
+Serves a scripted workflow run: its jobs endpoint, the run itself and the
+check runs of its check suite, with pagination (``per_page``/``page``,
+``total_count`` and Link headers), ETags and 304s, rate-limit headers and
+403s once the quota is used up. Latency and 5xx responses can be injected
+to exercise the client's retry and connection handling.
+
+Every job follows a lifecycle given in seconds since the simulation
+started: it appears (queued) at ``queued_at``, runs from ``started_at`` and
+concludes at ``completed_at``, finishing its steps evenly in between.
+
+Usage:
+    python3 simulator.py --jobs 100 --port 8000
+    GITHUB_API_URL=http://127.0.0.1:8000 ... python3 check_status.py
+"""
+import argparse
+import hashlib
+import http.server
+import json
+import random
+import threading
+import time
+import urllib.parse
+
+from clock import SystemClock
+
+REPO = "eidp/simulated"
+RUN_ID = 1
+CHECK_SUITE_ID = 1000
+MAX_PER_PAGE = 100
+DEFAULT_PER_PAGE = 30
+
+
+def format_timestamp(epoch):
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(epoch))
+
+
+class SimulatedJob:
+    """Lifecycle of one job, in seconds since the simulation started."""
+
+    def __init__(self, name, queued_at=0, started_at=1, completed_at=5, conclusion="success", steps=5, failed_step=None):
+        self.name = name
+        self.queued_at = queued_at
+        self.started_at = started_at
+        self.completed_at = completed_at
+        self.conclusion = conclusion
+        self.steps = steps
+        # 1-based number of the step that fails, when the job fails at a step.
+        self.failed_step = failed_step
+
+    def snapshot(self, job_id, elapsed, epoch):
+        """Return the job as the jobs API reports it ``elapsed`` seconds in, or ``None`` before it appears."""
+        if elapsed < self.queued_at:
+            return None
+        started = elapsed >= self.started_at
+        completed = elapsed >= self.completed_at
+        step_length = (self.completed_at - self.started_at) / max(self.steps, 1)
+        steps = []
+        for number in range(1, self.steps + 1):
+            step_started = self.started_at + (number - 1) * step_length
+            step_completed = step_started + step_length
+            if completed or elapsed >= step_completed:
+                status = "completed"
+                if self.failed_step is not None and number > self.failed_step:
+                    conclusion = "skipped"
+                elif number == self.failed_step:
+                    conclusion = "failure"
+                else:
+                    conclusion = "success"
+            elif elapsed >= step_started:
+                status, conclusion = "in_progress", None
+            else:
+                status, conclusion = "queued", None
+            steps.append({
+                "name": f"Step {number}",
+                "status": status,
+                "conclusion": conclusion,
+                "number": number,
+                "started_at": format_timestamp(epoch + step_started) if status != "queued" else None,
+                "completed_at": format_timestamp(epoch + step_completed) if status == "completed" else None,
+            })
+        return {
+            "id": job_id,
+            "run_id": RUN_ID,
+            "name": self.name,
+            "status": "completed" if completed else "in_progress" if started else "queued",
+            "conclusion": self.conclusion if completed else None,
+            "created_at": format_timestamp(epoch + self.queued_at),
+            "started_at": format_timestamp(epoch + self.started_at) if started else None,
+            "completed_at": format_timestamp(epoch + self.completed_at) if completed else None,
+            "html_url": f"https://github.com/{REPO}/actions/runs/{RUN_ID}/job/{job_id}",
+            "labels": ["ubuntu-latest"],
+            "runner_name": f"GitHub Actions {job_id}",
+            "steps": steps,
+        }
+
+
+def synthetic_jobs(count, duration=4.0, seed=0):
+    """Return ``count`` successful jobs that appear within the first second and finish within ``duration``."""
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        queued_at = rng.uniform(0, 0.5)
+        started_at = queued_at + rng.uniform(0, 0.5)
+        jobs.append(SimulatedJob(f"job {i}", queued_at, started_at, rng.uniform(started_at + 1, duration)))
+    return jobs
+
+
+def job_snapshots(jobs, elapsed, epoch):
+    """Return the jobs visible ``elapsed`` seconds into a run that started at ``epoch``, with ids from 1."""
+    snapshots = (job.snapshot(job_id, elapsed, epoch) for job_id, job in enumerate(jobs, start=1))
+    return [job for job in snapshots if job is not None]
+
+
+class SimulatedSource:
+    """
+    Job source that reads the scripted jobs directly instead of over HTTP.
+
+    Pair it with a clock.SimulatedClock to run a whole scenario through
+    check_status() in milliseconds. As with a 304, an unchanged snapshot is
+    returned as the same object as the previous poll.
+    """
+
+    name = "simulated"
+
+    def __init__(self, jobs, clock):
+        self.jobs = list(jobs)
+        self.clock = clock
+        self.epoch = clock.time()
+        self.polls = 0
+        self._snapshot = None
+
+    def poll(self):
+        self.polls += 1
+        jobs = job_snapshots(self.jobs, self.clock.time() - self.epoch, self.epoch)
+        if self._snapshot is None or jobs != self._snapshot["jobs"]:
+            self._snapshot = {"total_count": len(jobs), "jobs": jobs}
+        return self._snapshot
+
+
+class Simulator:
+    """
+    A scripted workflow run served over HTTP on a local port.
+
+    ``latency_seconds`` delays every response, ``error_rate`` is the chance
+    that a request fails with a 502 (drawn from a seeded generator) and
+    ``rate_limit`` is the request quota; 304s do not count against it,
+    as on GitHub. ``clock`` drives the job lifecycles. The request
+    counters are served as JSON at ``/_simulator/stats``.
+    """
+
+    def __init__(self, jobs, latency_seconds=0, error_rate=0, rate_limit=5000, seed=0, clock=None, port=0):
+        self.jobs = list(jobs)
+        self.latency_seconds = latency_seconds
+        self.error_rate = error_rate
+        self.clock = clock or SystemClock()
+        self.epoch = self.clock.time()
+        self.remaining = rate_limit
+        self.rate_limit = rate_limit
+        self.stats = {"requests": 0, "not_modified": 0, "errors": 0, "rate_limited": 0, "polls": 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = http.server.ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._server.daemon_threads = True
+        self.api_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = None
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread = None
+        self._server.server_close()
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def current_jobs(self):
+        return job_snapshots(self.jobs, self.clock.time() - self.epoch, self.epoch)
+
+    def counters(self):
+        with self._lock:
+            return dict(self.stats, remaining=self.remaining)
+
+    def respond(self, path, if_none_match=None):
+        """Return ``(status, headers, body)`` for a GET of ``path``."""
+        with self._lock:
+            self.stats["requests"] += 1
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.stats["errors"] += 1
+                return 502, {}, {"message": "Server Error"}
+            if self.remaining <= 0:
+                self.stats["rate_limited"] += 1
+                return 403, self._rate_limit_headers(), {"message": "API rate limit exceeded"}
+
+        url = urllib.parse.urlsplit(path)
+        query = dict(urllib.parse.parse_qsl(url.query))
+        run_path = f"/repos/{REPO}/actions/runs/{RUN_ID}"
+        if url.path == run_path:
+            body = {"id": RUN_ID, "check_suite_id": CHECK_SUITE_ID, "status": "in_progress"}
+            links = {}
+        elif url.path == f"{run_path}/jobs":
+            body, links = self._page("jobs", self.current_jobs(), url.path, query)
+        elif url.path == f"/repos/{REPO}/check-suites/{CHECK_SUITE_ID}/check-runs":
+            check_runs = [
+                {key: job[key] for key in ("id", "name", "status", "conclusion", "started_at", "completed_at", "html_url")}
+                for job in self.current_jobs()
+            ]
+            body, links = self._page("check_runs", check_runs, url.path, query)
+        else:
+            return 404, {}, {"message": "Not Found"}
+
+        payload = json.dumps(body, separators=(",", ":")).encode()
+        etag = f'"{hashlib.sha1(payload).hexdigest()[:16]}"'
+        with self._lock:
+            if query.get("page", "1") == "1" and url.path != run_path:
+                self.stats["polls"] += 1
+            if if_none_match == etag:
+                self.stats["not_modified"] += 1
+                return 304, dict(self._rate_limit_headers(), ETag=etag), None
+            self.remaining -= 1
+            headers = dict(self._rate_limit_headers(), ETag=etag)
+        if links:
+            headers["Link"] = ", ".join(f'<{link}>; rel="{rel}"' for rel, link in links.items())
+        return 200, headers, payload
+
+    def _page(self, key, items, path, query):
+        per_page = min(int(query.get("per_page", DEFAULT_PER_PAGE)), MAX_PER_PAGE)
+        page = int(query.get("page", 1))
+        last = max((len(items) + per_page - 1) // per_page, 1)
+        links = {}
+        if page < last:
+            next_query = urllib.parse.urlencode(dict(query, page=page + 1))
+            last_query = urllib.parse.urlencode(dict(query, page=last))
+            links = {"next": f"{self.api_url}{path}?{next_query}", "last": f"{self.api_url}{path}?{last_query}"}
+        return {"total_count": len(items), key: items[(page - 1) * per_page:page * per_page]}, links
+
+    def _rate_limit_headers(self):
+        return {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(max(self.remaining, 0)),
+            "X-RateLimit-Reset": str(int(self.epoch) + 3600),
+        }
+
+    def _handler_class(self):
+        simulator = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if self.path == "/_simulator/stats":
+                    status, headers, body = 200, {}, simulator.counters()
+                else:
+                    if simulator.latency_seconds:
+                        time.sleep(simulator.latency_seconds)
+                    status, headers, body = simulator.respond(self.path, self.headers.get("If-None-Match"))
+                if body is None:
+                    payload = b""
+                elif isinstance(body, bytes):
+                    payload = body
+                else:
+                    payload = json.dumps(body).encode()
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                if status != 304:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a simulated workflow run on a local port.")
+    parser.add_argument("--jobs", type=int, default=10, help="Number of synthetic jobs.")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds until the last job concludes.")
+    parser.add_argument("--latency", type=float, default=0, help="Seconds to delay every response.")
+    parser.add_argument("--error-rate", type=float, default=0, help="Fraction of requests answered with a 502.")
+    parser.add_argument("--rate-limit", type=int, default=5000)
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+
+    simulator = Simulator(
+        synthetic_jobs(args.jobs, args.duration),
+        latency_seconds=args.latency,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        port=args.port,
+    )
+    print(f"Serving {REPO} run {RUN_ID} with {args.jobs} job(s) at {simulator.api_url}")
+    try:
+        simulator.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.close()
+
+
+if __name__ == "__main__":
+    main()
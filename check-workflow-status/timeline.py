@@ -0,0 +1,54 @@
+"""
+Captured job timelines: the snapshots a gate saw while polling a run.
+
+A timeline file is newline-delimited JSON, gzip-compressed when its name
+ends in ``.gz``. The first line is a header describing the run; each
+following line is ``{"t": seconds since the gate started, "jobs": [...]}``
+and is only written when the snapshot differs from the previous poll, so
+a job list that stayed the same for minutes costs a single line.
+"""
+import gzip
+import json
+
+TIMELINE_VERSION = 1
+
+
+def open_timeline_file(path, mode):
+    """Open a timeline for text reading (``"r"``) or writing (``"w"``), gzip by extension."""
+    if str(path).endswith(".gz"):
+        return gzip.open(path, f"{mode}t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class TimelineWriter:
+    """Appends the distinct snapshots of one gate run to a timeline file."""
+
+    def __init__(self, path, **header):
+        self.path = path
+        self._file = open_timeline_file(path, "w")
+        self._last = None
+        self._write(dict(header, version=TIMELINE_VERSION))
+
+    def record(self, t, snapshot):
+        """Record the snapshot polled ``t`` seconds in, unless it is the previous poll's object."""
+        if snapshot is self._last:
+            return
+        self._last = snapshot
+        self._write({"t": round(t, 3), "jobs": snapshot.get("jobs", [])})
+
+    def close(self):
+        self._file.close()
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry, separators=(",", ":")))
+        self._file.write("\n")
+
+
+def read_timeline(path):
+    """Return ``(header, entries)`` of a timeline file, entries as ``(t, jobs)`` in time order."""
+    with open_timeline_file(path, "r") as f:
+        lines = (json.loads(line) for line in f if line.strip())
+        header = next(lines, None)
+        if header is None or header.get("version") != TIMELINE_VERSION:
+            raise ValueError(f"Not a version {TIMELINE_VERSION} timeline: {path}")
+        return header, [(entry["t"], entry["jobs"]) for entry in lines]
@@ -1,20 +1,89 @@
-from .generate_workflow_docs import generate_workflow_docs
-from .generate_workflow_list import generate_workflow_list
-from .generate_action_docs import generate_action_docs
-from .generate_action_list import generate_action_list
+import sys
+from pathlib import Path
 
-def generate_workflows():
+# The generators are imported inside the entry points, and they import yaml and
+# py-markdown-table only on a render cache miss, so a run with nothing to
+# regenerate starts fast. test_startup.py guards this.
+
+
+def _changed_filenames(filenames):
+    """
+    Return the changed files to regenerate docs for, or ``None`` for everything.
+
+    Defaults to the command-line arguments, as passed by pre-commit. No
+    arguments, or a change to the generators themselves, means a full run.
+    """
+    if filenames is None:
+        filenames = sys.argv[1:]
+    package_dir = Path(__file__).resolve().parent
+    if not filenames or any(Path(f).resolve().parent == package_dir for f in filenames):
+        return None
+    return filenames
+
+def _generate_workflows(filenames):
+    from .generate_workflow_docs import affected_workflow_files, generate_workflow_docs
+    from .generate_workflow_list import generate_workflow_list
+
+    if filenames is None:
+        generate_workflow_docs()
+    else:
+        files = affected_workflow_files(filenames)
+        if files:
+            generate_workflow_docs(files)
+    # Always rebuilt: cheap off the shared scan and render cache, and it drops deleted workflows.
+    generate_workflow_list()
+
+def _generate_actions(filenames):
+    from .generate_action_docs import affected_action_dirs, generate_action_docs
+    from .generate_action_list import generate_action_list
+
+    if filenames is None:
+        generate_action_docs()
+    else:
+        action_dirs = affected_action_dirs(filenames)
+        if action_dirs:
+            generate_action_docs(action_dirs)
+    # Always rebuilt: cheap off the shared scan, and it drops deleted actions.
+    generate_action_list()
+
+def generate_workflows(filenames=None):
     """
     Generate all documentation for workflows and actions.
     This function is intended to be run as a script.
+
+    When given changed ``filenames``, only the docs of the changed workflows
+    are regenerated; the workflow list is always rebuilt.
     """
-    generate_workflow_docs()
-    generate_workflow_list()
+    from .writer import summary
+
+    _generate_workflows(_changed_filenames(filenames))
+    print(summary())
 
-def generate_actions():
+def generate_actions(filenames=None):
     """
     Generate all documentation for actions.
     This function is intended to be run as a script.
+
+    When given changed ``filenames``, only the READMEs of the affected action
+    directories are regenerated; the action list is always rebuilt.
     """
-    generate_action_docs()
-    generate_action_list()
\ No newline at end of file
+    from .writer import summary
+
+    _generate_actions(_changed_filenames(filenames))
+    print(summary())
+
+def generate_docs(filenames=None):
+    """
+    Generate the documentation of workflows and actions in one process.
+    This function is intended to be run as a script.
+
+    Both share one repository scan and one parse of every YAML file, and
+    ``filenames`` narrow the run as for generate_workflows() and
+    generate_actions().
+    """
+    from .writer import summary
+
+    filenames = _changed_filenames(filenames)
+    _generate_workflows(filenames)
+    _generate_actions(filenames)
+    print(summary())
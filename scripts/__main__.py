@@ -0,0 +1,3 @@
+from . import generate_docs
+
+generate_docs()
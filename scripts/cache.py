@@ -0,0 +1,112 @@
+import contextlib
+import hashlib
+import importlib.util
+import json
+import os
+from pathlib import Path
+
+# Set ACTIONS_COMMON_CACHE_DIR to an empty string to disable the cache.
+_cache_dir = os.environ.get("ACTIONS_COMMON_CACHE_DIR", ".cache/actions-common")
+CACHE_DIR = Path(_cache_dir) if _cache_dir else None
+
+
+def content_hash(*parts) -> str:
+    """Hash a sequence of bytes/str/None parts, unambiguously delimited."""
+    digest = hashlib.sha256()
+    for part in parts:
+        data = b"\0missing" if part is None else part if isinstance(part, bytes) else str(part).encode()
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def read_source(path: Path):
+    """Return the bytes of a cache input, or ``None`` if it does not exist."""
+    try:
+        return Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _package_sources(name):
+    """Return the source of the modules of package ``name`` without importing it (or importlib.metadata)."""
+    spec = importlib.util.find_spec(name)
+    if spec is None or not spec.submodule_search_locations:
+        return []
+    return [read_source(path) for location in spec.submodule_search_locations
+            for path in sorted(Path(location).glob("*.py"))]
+
+
+class RenderCache:
+    """
+    On-disk cache of rendered documentation, keyed by a content hash.
+
+    The key covers the source files of a block and the generator version:
+    the source of the generator modules (and of this module and the YAML
+    model) plus the markdown table library's source, so editing a generator
+    or upgrading the library invalidates its entries without a manual bump.
+
+    Entries live in a directory per generator version, and the directories
+    of other versions are removed, so the cache never outgrows one version.
+    Each unit (an action, a workflow) has a single JSON entry, overwritten
+    atomically when its sources change, so concurrent writers never see a
+    partial entry and edits do not pile up. The cache root gets a
+    ``.gitignore`` ignoring everything, as ``.pytest_cache`` does, so it
+    never shows up as untracked in the checkouts running the hooks.
+    """
+
+    def __init__(self, namespace: str, *generator_files: Path, directory=CACHE_DIR):
+        here = Path(__file__)
+        self.version = content_hash(
+            *(read_source(path) for path in (here, here.with_name("repository.py"), *generator_files)),
+            *_package_sources("py_markdown_table"),
+        )
+        self.root = Path(directory) if directory is not None else None
+        self.directory = self.root / namespace / self.version[:16] if self.root is not None else None
+        if self.directory is not None:
+            self._prune()
+
+    def _prune(self):
+        """Remove the entries of every other generator version."""
+        try:
+            with os.scandir(self.directory.parent) as it:
+                stale = [entry for entry in it if entry.name != self.directory.name]
+        except FileNotFoundError:
+            return
+        if not stale:
+            return
+        # Imported here: only needed after a generator or library change.
+        import shutil
+
+        for entry in stale:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(entry.path)
+
+    def get_or_render(self, name: str, sources, render):
+        """Return the cached value of unit ``name`` for ``sources`` (bytes/str parts), calling ``render()`` on a miss."""
+        if self.directory is None:
+            return render()
+        key = content_hash(self.version, *sources)
+        path = self.directory / f"{content_hash(name)[:32]}.json"
+        try:
+            entry = json.loads(path.read_text())
+            if entry["key"] == key:
+                return entry["value"]
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            pass
+        value = render()
+        self._write(path, {"key": key, "value": value})
+        return value
+
+    def _write(self, path: Path, entry):
+        gitignore = self.root / ".gitignore"
+        if not gitignore.exists():
+            self.root.mkdir(parents=True, exist_ok=True)
+            gitignore.write_text("# Created by actions-common automatically.\n*\n")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entry))
+        os.replace(tmp_path, path)
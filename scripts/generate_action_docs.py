@@ -6,39 +6,37 @@
 # ]
 # ///
 
-import yaml
-import subprocess
+from functools import partial
 from pathlib import Path
-import re
-from py_markdown_table.markdown_table import markdown_table
+
+try:
+    from .cache import RenderCache, read_source
+    from .pool import map_in_order
+    from .repo_identity import resolve_repository
+    from .repository import get_repository
+    from .scanner import get_scan
+    from .writer import write_if_changed
+except ImportError:  # Run as a standalone script
+    from cache import RenderCache, read_source
+    from pool import map_in_order
+    from repo_identity import resolve_repository
+    from repository import get_repository
+    from scanner import get_scan
+    from writer import write_if_changed
 
 ACTIONS_DIR = Path("./")
 DEFAULT_VERSION = "v0"
 
-def get_repo_info_from_git():
-    try:
-        url = subprocess.check_output(["git", "config", "--get", "remote.origin.url"], text=True).strip()
-        # Matches:
-        #   git@github.com:org/repo.git
-        #   https://github.com/org/repo.git
-        match = re.search(r"github\.com[:/](?P<org_repo>[^/]+/[^/]+?)(?:\.git)?$", url)
-        if match:
-            return match.group("org_repo")
-        else:
-            raise ValueError("Could not parse GitHub org/repo from URL.")
-    except Exception as e:
-        print(f"⚠️ Failed to detect GitHub org/repo from git: {e}")
-        return "your-org/your-repo"
-
 def parse_action_file(action_dir: Path, repo_ref: str):
-    action_file = action_dir / "action.yml"
-    if not action_file.exists():
-        action_file = action_dir / "action.yaml"
-    if not action_file.exists():
+    # Imported here: only cache misses render tables.
+    from py_markdown_table.markdown_table import markdown_table
+
+    repository = get_repository()
+    action_file = repository.action_file(action_dir)
+    if action_file is None:
         return None, None
 
-    with action_file.open() as f:
-        data = yaml.load(f, Loader=yaml.BaseLoader)
+    data = repository.load(action_file)
 
     name = data.get("name", action_dir.name)
     description = data.get("description", "").strip()
@@ -99,7 +97,7 @@ def parse_action_file(action_dir: Path, repo_ref: str):
 
 def update_readme(readme_path: Path, name: str, block: str):
     if not readme_path.exists():
-        readme_path.write_text(block + "\n")
+        write_if_changed(readme_path, block + "\n")
         print(f"✅ Created README.md with docs for {name}")
         return
 
@@ -107,21 +105,42 @@ def update_readme(readme_path: Path, name: str, block: str):
     # Unescape GitHub Actions syntax
     content = content.replace(r'\$\{\{', '${{').replace(r'\}\}', '}}')
 
-    readme_path.write_text(content)
-    print(f"✅ Generated: {readme_path} with action: {name}")
+    if write_if_changed(readme_path, content):
+        print(f"✅ Generated: {readme_path} with action: {name}")
 
 def find_action_dirs():
-    action_dirs = []
-    if ACTIONS_DIR.exists():
-        for d in ACTIONS_DIR.iterdir():
-            if d.is_dir() and ((d / "action.yml").exists() or (d / "action.yaml").exists()):
-                action_dirs.append(d)
-    return action_dirs
-
-def generate_action_docs():
-    repo_ref = get_repo_info_from_git()
-    for action_dir in find_action_dirs():
-        name, block = parse_action_file(action_dir, repo_ref)
+    return get_scan().action_dirs(ACTIONS_DIR)
+
+def affected_action_dirs(filenames):
+    """Return the action directories whose docs depend on any of the changed ``filenames``."""
+    action_dirs = set()
+    for filename in filenames:
+        parts = Path(filename).parts
+        if len(parts) == 2 and parts[1] in ("action.yml", "action.yaml", "EXAMPLES.md"):
+            action_dir = ACTIONS_DIR / parts[0]
+            if get_repository().action_file(action_dir) is not None:
+                action_dirs.add(action_dir)
+    return sorted(action_dirs)
+
+def render_action_docs(cache: RenderCache, repo_ref: str, action_dir: Path):
+    """Return ``(name, block)`` of one action directory; runs in a worker process."""
+    action_file = get_repository().action_file(action_dir)
+    sources = (action_dir.name, repo_ref, action_file.name, read_source(action_file),
+               read_source(action_dir / "EXAMPLES.md"))
+    return cache.get_or_render(action_dir.name, sources, lambda: parse_action_file(action_dir, repo_ref))
+
+def generate_action_docs(action_dirs=None, workers=None):
+    """
+    Generate the README of every action, or only of ``action_dirs`` when given.
+
+    Actions are parsed and rendered by up to ``workers`` processes (see
+    pool.map_in_order); the READMEs are written here, in directory order.
+    """
+    repo_ref = resolve_repository()
+    cache = RenderCache("action-docs", Path(__file__))
+    action_dirs = find_action_dirs() if action_dirs is None else action_dirs
+    rendered = map_in_order(partial(render_action_docs, cache, repo_ref), action_dirs, workers)
+    for action_dir, (name, block) in zip(action_dirs, rendered):
         if block:
             readme = Path(action_dir / "README.md")
             update_readme(readme, name, block)
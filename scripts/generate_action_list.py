@@ -5,6 +5,13 @@
 from pathlib import Path
 import re
 
+try:
+    from .scanner import get_scan
+    from .writer import write_if_changed
+except ImportError:  # Run as a standalone script
+    from scanner import get_scan
+    from writer import write_if_changed
+
 ACTIONS_HEADER = "## 🛠️ GitHub Actions"
 ACTIONS_MARKER_START = "<!-- BEGIN ACTIONS -->"
 ACTIONS_MARKER_END = "<!-- END ACTIONS -->"
@@ -12,7 +19,7 @@ README_PATH = Path("README.md")
 
 def _generate_action_list() -> str:
     items = []
-    for action_file in Path(".").rglob("action.y*ml"):
+    for action_file in get_scan().action_files:
         action_dir = action_file.parent
         readme = action_dir / "README.md"
         if readme.exists():
@@ -40,8 +47,8 @@ def update_readme(content_block):
         updated = marker_pattern.sub(new_block, content)
     else:
         updated = content.strip() + "\n\n" + new_block + "\n"
-    README_PATH.write_text(updated)
-    print("✅ Updated README.md with action links.")
+    if write_if_changed(README_PATH, updated):
+        print("✅ Updated README.md with action links.")
 
 def generate_action_list():
     content_block = _generate_action_list()
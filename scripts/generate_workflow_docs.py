@@ -6,30 +6,39 @@
 # ]
 # ///
 
-import yaml
+from functools import partial
 from pathlib import Path
 import re
-from py_markdown_table.markdown_table import markdown_table
 
-WORKFLOWS_DIR = Path(".github/workflows")
+try:
+  from .cache import RenderCache, read_source
+  from .pool import map_in_order
+  from .repository import WORKFLOWS_DIR, get_repository
+  from .writer import write_if_changed
+except ImportError:  # Run as a standalone script
+  from cache import RenderCache, read_source
+  from pool import map_in_order
+  from repository import WORKFLOWS_DIR, get_repository
+  from writer import write_if_changed
+
 MARKER_TEMPLATE = "<!-- BEGIN WORKFLOW INPUT DOCS: {name} -->"
 MARKER_END = "<!-- END WORKFLOW INPUT DOCS -->"
 
 
 def parse_workflow_file(file_path: Path):
-  with file_path.open() as f:
-    data = yaml.load(f, Loader=yaml.BaseLoader)
-
-  if not data or not isinstance(data.get("on"), dict) or "workflow_call" not in data["on"]:
-    print(f"⚠️ Skipping {file_path} - not a valid workflow file or missing 'workflow_call' trigger.")
+  # Imported here: only cache misses render tables.
+  from py_markdown_table.markdown_table import markdown_table
 
+  repository = get_repository()
+  workflow_call = repository.workflow_call(file_path)
+  if workflow_call is None:
     return None, None
 
-  workflow_name = data.get("name", file_path.stem)
+  workflow_name = repository.load(file_path).get("name", file_path.stem)
 
-  inputs = data["on"]["workflow_call"].get("inputs", {})
-  secrets = data["on"]["workflow_call"].get("secrets", {})
-  outputs = data["on"]["workflow_call"].get("outputs", {})
+  inputs = workflow_call.get("inputs", {})
+  secrets = workflow_call.get("secrets", {})
+  outputs = workflow_call.get("outputs", {})
 
   input_rows = []
   for name, meta in inputs.items():
@@ -68,13 +77,14 @@ def parse_workflow_file(file_path: Path):
   return workflow_name, f"{header}\n\n{block}"
 
 
-def update_readme(readme_path: Path, name: str, block: str):
-  if not readme_path.exists():
-    readme_path.write_text(block + "\n")
-    print(f"✅ Created README.md with docs for {name}")
-    return
+MARKER_REGION_PATTERN = re.compile(
+  re.escape(MARKER_TEMPLATE).replace(r"\{name\}", "(?P<name>.*?)") + ".*?" + re.escape(MARKER_END),
+  re.DOTALL,
+)
 
-  content = readme_path.read_text()
+
+def splice_block(content: str, name: str, block: str):
+  """Return ``content`` with the doc block of workflow ``name`` spliced in, and what was done."""
   block_start = MARKER_TEMPLATE.format(name=name)
   header_pattern = rf"(## {re.escape(name)} \(Workflow\))"
   marker_pattern = rf"{re.escape(block_start)}.*?{re.escape(MARKER_END)}"
@@ -84,9 +94,9 @@ def update_readme(readme_path: Path, name: str, block: str):
 
   if marker_match:
     # Replace just the inner block
-    content = re.sub(marker_pattern, block.split("\n", 1)[1].strip(), content, flags=re.DOTALL)
-    print(f"✅ Updated: {readme_path} (replaced existing block for {name})")
-  elif header_match:
+    content = re.sub(marker_pattern, lambda _: block.split("\n", 1)[1].strip(), content, flags=re.DOTALL)
+    return content, f"replaced existing block for {name}"
+  if header_match:
     # Header exists, but no doc block yet – insert after header
     insert_pos = header_match.end()
     content = (
@@ -96,21 +106,90 @@ def update_readme(readme_path: Path, name: str, block: str):
         + "\n\n"
         + content[insert_pos:].lstrip()
     )
-    print(f"✅ Updated: {readme_path} (inserted new block under existing header for {name})")
-  else:
-    # Header doesn't exist – append entire block at the end
-    content = content.strip() + "\n\n" + block + "\n"
-    print(f"✅ Updated: {readme_path} (appended full block for {name})")
+    return content, f"inserted new block under existing header for {name}"
+  # Header doesn't exist – append entire block at the end
+  content = content.strip() + "\n\n" + block + "\n"
+  return content, f"appended full block for {name}"
 
-  readme_path.write_text(content)
 
+def update_readme(readme_path: Path, name: str, block: str):
+  if not readme_path.exists():
+    write_if_changed(readme_path, block + "\n")
+    print(f"✅ Created README.md with docs for {name}")
+    return
 
-def generate_workflow_docs():
-  for file in WORKFLOWS_DIR.glob("*.yml"):
-    name, block = parse_workflow_file(file)
+  content, action = splice_block(readme_path.read_text(), name, block)
+  if write_if_changed(readme_path, content):
+    print(f"✅ Updated: {readme_path} ({action})")
+
+
+def update_readme_blocks(readme_path: Path, blocks):
+  """
+  Splice the doc blocks of many workflows (``{name: block}``) into one README.
+
+  The README is read once, every existing marker region is replaced in a
+  single scan, and the file is written once. Only workflows without a
+  region yet go through splice_block(), as update_readme() would.
+  """
+  content = readme_path.read_text() if readme_path.exists() else None
+  replaced = set()
+
+  def replace_region(match):
+    name = match.group("name")
+    if name not in blocks:
+      return match.group(0)
+    replaced.add(name)
+    return blocks[name].split("\n", 1)[1].strip()
+
+  actions = []
+  if content is not None:
+    content = MARKER_REGION_PATTERN.sub(replace_region, content)
+    actions = [f"replaced existing block for {name}" for name in blocks if name in replaced]
+  for name, block in blocks.items():
+    if name in replaced:
+      continue
+    if content is None:
+      content, action = block + "\n", f"created with docs for {name}"
+    else:
+      content, action = splice_block(content, name, block)
+    actions.append(action)
+
+  if write_if_changed(readme_path, content):
+    print(f"✅ Updated: {readme_path} ({'; '.join(actions)})")
+
+
+def affected_workflow_files(filenames):
+  """Return the existing workflow files among the changed ``filenames``."""
+  files = set()
+  for filename in filenames:
+    path = Path(filename)
+    if path.parent == WORKFLOWS_DIR and path.suffix == ".yml" and path.exists():
+      files.add(path)
+  return sorted(files)
+
+
+def render_workflow_docs(cache: RenderCache, file: Path):
+  """Return ``(name, block)`` of one workflow file; runs in a worker process."""
+  return cache.get_or_render(file.stem, (file.stem, read_source(file)), lambda: parse_workflow_file(file))
+
+
+def generate_workflow_docs(files=None, workers=None):
+  """
+  Generate the docs of every shared workflow, or only of the workflow ``files`` when given.
+
+  Workflows are parsed and rendered by up to ``workers`` processes (see
+  pool.map_in_order); each README is then updated here in one write.
+  """
+  cache = RenderCache("workflow-docs", Path(__file__))
+  files = get_repository().workflow_files() if files is None else files
+  readmes = {}
+  for file, (name, block) in zip(files, map_in_order(partial(render_workflow_docs, cache), files, workers)):
     if block:
-      readme = file.with_name("README.md")
-      update_readme(readme, name, block)
+      readmes.setdefault(file.with_name("README.md"), {})[name] = block
+    else:
+      print(f"⚠️ Skipping {file} - not a valid workflow file or missing 'workflow_call' trigger.")
+  for readme, blocks in readmes.items():
+    update_readme_blocks(readme, blocks)
 
 
 if __name__ == "__main__":
@@ -3,34 +3,42 @@
 # dependencies = ["pyyaml"]
 # ///
 
-import yaml
 from pathlib import Path
 import re
 
-WORKFLOWS_DIR = Path(".github/workflows")
+try:
+    from .cache import RenderCache, read_source
+    from .repository import get_repository
+    from .writer import write_if_changed
+except ImportError:  # Run as a standalone script
+    from cache import RenderCache, read_source
+    from repository import get_repository
+    from writer import write_if_changed
+
 README_PATH = Path("README.md")
 LIST_HEADER = "## 📚 Shared Workflows"
 MARKER_START = "<!-- BEGIN SHARED WORKFLOWS -->"
 MARKER_END = "<!-- END SHARED WORKFLOWS -->"
 
 def is_shared_workflow(file_path: Path) -> bool:
-    with open(file_path) as f:
-        data = yaml.load(f, Loader=yaml.BaseLoader)
-    return isinstance(data.get("on"), dict) and "workflow_call" in data["on"]
+    return get_repository().workflow_call(file_path) is not None
 
 def create_slug(name: str) -> str:
     return re.sub(r"[^\w\- ]", "", name.lower()).replace(" ", "-") + "-workflow"
 
 def generate_shared_workflow_list() -> str:
+    repository = get_repository()
+    cache = RenderCache("workflow-list", Path(__file__))
     items = []
-    for wf_file in sorted(WORKFLOWS_DIR.glob("*.yml")):
-        with wf_file.open() as f:
-            data = yaml.load(f, Loader=yaml.BaseLoader)
-
-        if not isinstance(data.get("on"), dict) or "workflow_call" not in data["on"]:
+    for wf_file in repository.workflow_files():
+        name = cache.get_or_render(
+            wf_file.stem,
+            (wf_file.stem, read_source(wf_file)),
+            lambda: repository.load(wf_file).get("name", wf_file.stem) if is_shared_workflow(wf_file) else None,
+        )
+        if name is None:
             continue
 
-        name = data.get("name", wf_file.stem)
         slug = create_slug(name)
         items.append(f"- [{name}](./.github/workflows/README.md#{slug})")
 
@@ -44,7 +52,7 @@ def generate_shared_workflow_list() -> str:
 
 def update_readme(path: Path, new_list: str):
     if not path.exists():
-        path.write_text(new_list + "\n")
+        write_if_changed(path, new_list + "\n")
         print(f"✅ Created {path} with shared workflow list.")
         return
 
@@ -61,8 +69,8 @@ def update_readme(path: Path, new_list: str):
         # Add to the end of the file if no markers found
         content = content.strip() + "\n\n" + new_list + "\n"
 
-    path.write_text(content)
-    print(f"✅ Updated: {path} with shared workflow list.")
+    if write_if_changed(path, content):
+        print(f"✅ Updated: {path} with shared workflow list.")
 
 def generate_workflow_list():
     new_list = generate_shared_workflow_list()
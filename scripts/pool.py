@@ -0,0 +1,37 @@
+import os
+
+# Set ACTIONS_COMMON_WORKERS to 1 to generate serially.
+_workers = os.environ.get("ACTIONS_COMMON_WORKERS", "")
+WORKERS = int(_workers) if _workers else os.cpu_count() or 1
+
+# Below this many units, starting worker processes costs more than it saves.
+MIN_PARALLEL_UNITS = 16
+
+
+def map_in_order(func, items, workers=None):
+    """
+    Return ``[func(item) for item in items]``, computed in a process pool.
+
+    Results come back in the order of ``items`` whatever order the workers
+    finish in, so callers can apply them exactly as a serial run would.
+    ``func`` must be picklable (a module-level function or a partial of
+    one). With one worker, with fewer than MIN_PARALLEL_UNITS items and no
+    explicit ``workers``, or where processes cannot be started, the items
+    are processed serially in this process.
+    """
+    items = list(items)
+    if workers is None:
+        workers = WORKERS if len(items) >= MIN_PARALLEL_UNITS else 1
+    workers = min(workers, len(items))
+    if workers > 1:
+        # Imported here: most runs are too small for a pool, and concurrent.futures is slow to import.
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(func, items, chunksize=max(len(items) // (workers * 4), 1)))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # No working multiprocessing here (e.g. no /dev/shm in a sandbox); fall back.
+            pass
+    return [func(item) for item in items]
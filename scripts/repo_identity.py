@@ -0,0 +1,117 @@
+import os
+import re
+from pathlib import Path
+
+DEFAULT_REPOSITORY = "your-org/your-repo"
+
+# Matches:
+#   git@github.com:org/repo.git
+#   https://github.com/org/repo.git
+GITHUB_URL_PATTERN = re.compile(r"github\.com[:/](?P<org_repo>[^/]+/[^/]+?)(?:\.git)?/?$")
+SECTION_PATTERN = re.compile(r'^\[\s*(?P<section>[^\s\]"]+)(?:\s+"(?P<subsection>(?:[^"\\]|\\.)*)")?\s*\]')
+
+
+def find_git_dir(start="."):
+    """
+    Return the git directory holding the config of the checkout around ``start``.
+
+    Honours ``GIT_DIR``, and follows ``.git`` files (worktrees, submodules)
+    to their git directory and a worktree's ``commondir`` to the main one.
+    """
+    if os.environ.get("GIT_DIR"):
+        git_dir = Path(os.environ["GIT_DIR"])
+    else:
+        start = Path(start).resolve()
+        for directory in (start, *start.parents):
+            git_dir = directory / ".git"
+            if git_dir.exists():
+                break
+        else:
+            return None
+    if git_dir.is_file():
+        content = git_dir.read_text().strip()
+        if not content.startswith("gitdir:"):
+            return None
+        git_dir = git_dir.parent / content[len("gitdir:"):].strip()
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
+        git_dir = git_dir / commondir.read_text().strip()
+    return git_dir
+
+
+def read_git_config(path: Path):
+    """Return the values of a git config file as ``{(section, subsection): {key: value}}``, last value winning."""
+    config = {}
+    values = None
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith(("#", ";")):
+            continue
+        match = SECTION_PATTERN.match(line)
+        if match:
+            section = match.group("section").lower()
+            subsection = match.group("subsection")
+            if subsection is None and "." in section:
+                # Deprecated [section.subsection] syntax
+                section, subsection = section.split(".", 1)
+            values = config.setdefault((section, subsection), {})
+            line = line[match.end():].strip()
+            if not line:
+                continue
+        if values is None:
+            continue
+        key, _, value = line.partition("=")
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            value = value[1:-1]
+        values[key.strip().lower()] = value
+    return config
+
+
+def repository_from_url(url: str):
+    """Return ``org/repo`` of a GitHub remote URL, or ``None`` for other hosts."""
+    match = GITHUB_URL_PATTERN.search(url.strip())
+    return match.group("org_repo") if match else None
+
+
+def repository_from_git(root=".", remote="origin") -> str:
+    """Return ``org/repo`` of the ``remote`` of the checkout at ``root``, read from its git config."""
+    git_dir = find_git_dir(root)
+    if git_dir is None:
+        raise ValueError("Not inside a git checkout.")
+    try:
+        config = read_git_config(git_dir / "config")
+    except OSError as e:
+        raise ValueError(f"Could not read git config: {e}") from e
+    url = config.get(("remote", remote), {}).get("url")
+    if url is None:
+        raise ValueError(f"No URL configured for remote '{remote}'.")
+    repository = repository_from_url(url)
+    if repository is None:
+        raise ValueError("Could not parse GitHub org/repo from URL.")
+    return repository
+
+
+_resolved = {}
+
+
+def resolve_repository(root=".", override=None) -> str:
+    """
+    Return the ``org/repo`` the docs of the checkout at ``root`` refer to.
+
+    In order of precedence: ``override``, the ACTIONS_COMMON_REPOSITORY and
+    GITHUB_REPOSITORY environment variables, and the origin remote in the
+    git config. Falls back to DEFAULT_REPOSITORY with a warning. The result
+    is memoized for the process.
+    """
+    explicit = override or os.environ.get("ACTIONS_COMMON_REPOSITORY") or os.environ.get("GITHUB_REPOSITORY")
+    if explicit:
+        return explicit
+    key = Path(root).resolve()
+    if key not in _resolved:
+        try:
+            _resolved[key] = repository_from_git(root)
+        except ValueError as e:
+            print(f"⚠️ Failed to detect GitHub org/repo from git: {e}")
+            _resolved[key] = DEFAULT_REPOSITORY
+    return _resolved[key]
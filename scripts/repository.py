@@ -0,0 +1,68 @@
+from pathlib import Path
+
+try:
+    from .scanner import ACTION_FILE_NAMES, WORKFLOWS_PATH, get_scan
+except ImportError:  # Run as a standalone script
+    from scanner import ACTION_FILE_NAMES, WORKFLOWS_PATH, get_scan
+
+WORKFLOWS_DIR = Path(WORKFLOWS_PATH)
+
+
+class Repository:
+    """
+    Parse-once view of the workflows and actions in a checkout.
+
+    Every generator reads YAML through the same instance, so each file is
+    parsed at most once per run however many generators look at it. Parsed
+    documents are keyed by path, modification time and size, so an edited
+    file is picked up again.
+    """
+
+    def __init__(self, root="."):
+        self.root = Path(root)
+        self._documents = {}
+
+    def load(self, path):
+        """Return the parsed YAML document at ``path``."""
+        path = Path(path)
+        stat = path.stat()
+        key = (path.resolve(), stat.st_mtime_ns, stat.st_size)
+        if key not in self._documents:
+            # Imported here: runs served from the render cache never parse YAML.
+            import yaml
+
+            # libyaml's C loader is several times faster; BaseLoader keeps every scalar a string
+            # (so `on:` stays a key and `required: true` stays "true"), matching what the generators expect.
+            loader = getattr(yaml, "CBaseLoader", yaml.BaseLoader)
+            with path.open() as f:
+                self._documents[key] = yaml.load(f, Loader=loader)
+        return self._documents[key]
+
+    def workflow_files(self):
+        return get_scan(self.root).workflow_files
+
+    def workflow_call(self, path):
+        """Return the ``workflow_call`` trigger of a workflow, or ``None`` if it is not a shared workflow."""
+        data = self.load(path)
+        if not isinstance(data, dict) or not isinstance(data.get("on"), dict) or "workflow_call" not in data["on"]:
+            return None
+        return data["on"]["workflow_call"] or {}
+
+    def action_file(self, action_dir):
+        """Return the action metadata file of a directory, or ``None`` if it is not an action."""
+        for file_name in ACTION_FILE_NAMES:
+            action_file = Path(action_dir) / file_name
+            if action_file.exists():
+                return action_file
+        return None
+
+
+_repositories = {}
+
+
+def get_repository(root="."):
+    """Return the shared Repository of ``root`` for this process."""
+    key = Path(root).resolve()
+    if key not in _repositories:
+        _repositories[key] = Repository(root)
+    return _repositories[key]
@@ -0,0 +1,115 @@
+import fnmatch
+import os
+from pathlib import Path
+
+# Never descended into, whatever the .gitignore files say.
+EXCLUDED_DIRS = frozenset({".git", "node_modules", ".venv", "venv", "__pycache__", ".tox", ".nox", ".cache"})
+WORKFLOWS_PATH = ".github/workflows"
+ACTION_FILE_NAMES = ("action.yml", "action.yaml")
+
+
+def read_gitignore(path: Path):
+    """
+    Return the patterns of a .gitignore file as ``(pattern, anchored, negated)`` tuples.
+
+    Anchored patterns (containing a ``/``) match the path relative to the
+    .gitignore's directory, the others match a name at any depth.
+    """
+    try:
+        lines = path.read_text().splitlines()
+    except (OSError, UnicodeDecodeError):
+        return []
+    patterns = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        pattern = line[negated:].rstrip("/")
+        if pattern.startswith("**/"):
+            pattern = pattern[3:]
+        if pattern:
+            patterns.append((pattern.lstrip("/"), "/" in pattern, negated))
+    return patterns
+
+
+def is_ignored(rel_path: str, name: str, rules) -> bool:
+    """
+    Return whether the directory at ``rel_path`` is ignored by the ``(base, patterns)`` rules.
+
+    As in git, the last matching pattern wins, a deeper .gitignore overrides
+    a shallower one, and a negation re-includes the directory it matches.
+    Nothing below a pruned directory is walked, so a negation can never
+    re-include one of its children, which matches git as well.
+    """
+    ignored = False
+    for base, patterns in rules:
+        relative = rel_path[len(base) + 1:] if base else rel_path
+        for pattern, anchored, negated in patterns:
+            if fnmatch.fnmatchcase(relative if anchored else name, pattern):
+                ignored = not negated
+    return ignored
+
+
+class RepositoryScan:
+    """The action and workflow files of a checkout, found in one walk."""
+
+    def __init__(self, action_files, workflow_files):
+        self.action_files = action_files
+        self.workflow_files = workflow_files
+
+    def action_dirs(self, parent: Path = Path(".")):
+        """Return the action directories directly below ``parent``."""
+        return [action_file.parent for action_file in self.action_files if action_file.parent.parent == parent]
+
+
+def scan(root=".", exclude=EXCLUDED_DIRS) -> RepositoryScan:
+    """
+    Walk ``root`` once with os.scandir and classify the files the generators need.
+
+    Directories named in ``exclude`` or ignored by a .gitignore on the way
+    down are pruned rather than walked. Every directory's action file
+    (``action.yml`` preferred over ``action.yaml``) and the ``*.yml`` files
+    in ``.github/workflows`` are collected, both sorted by path.
+    """
+    root = Path(root)
+    action_files = []
+    workflow_files = []
+    stack = [(root, "", [])]
+    while stack:
+        directory, rel_path, rules = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        file_names = {entry.name for entry in entries if entry.is_file()}
+        if ".gitignore" in file_names:
+            rules = rules + [(rel_path, read_gitignore(directory / ".gitignore"))]
+
+        for file_name in ACTION_FILE_NAMES:
+            if file_name in file_names:
+                action_files.append(directory / file_name)
+                break
+        if rel_path == WORKFLOWS_PATH:
+            workflow_files.extend(directory / name for name in file_names if name.endswith(".yml"))
+
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False) or entry.name in exclude:
+                continue
+            child_path = f"{rel_path}/{entry.name}" if rel_path else entry.name
+            if not is_ignored(child_path, entry.name, rules):
+                stack.append((directory / entry.name, child_path, rules))
+
+    return RepositoryScan(sorted(action_files), sorted(workflow_files))
+
+
+_scans = {}
+
+
+def get_scan(root=".") -> RepositoryScan:
+    """Return the scan of ``root`` shared by every generator in this process."""
+    key = Path(root).resolve()
+    if key not in _scans:
+        _scans[key] = scan(root)
+    return _scans[key]
@@ -0,0 +1,246 @@
+# Tests for the doc generators
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# Import the generators as the package the console scripts run, also when run as a script.
+sys.path.insert(0, str(REPO_ROOT))
+
+from scripts.generate_action_docs import affected_action_dirs  # noqa: E402
+from scripts.generate_workflow_docs import (  # noqa: E402
+    MARKER_END, MARKER_TEMPLATE, affected_workflow_files, update_readme, update_readme_blocks,
+)
+from scripts.repo_identity import find_git_dir, read_git_config, repository_from_git, resolve_repository  # noqa: E402
+from scripts.scanner import scan  # noqa: E402
+
+WORKFLOW = """name: {name}
+on:
+  workflow_call:
+    inputs:
+      target:
+        description: Where to deploy.
+        type: string
+jobs:
+  example:
+    runs-on: ubuntu-latest
+    steps:
+      - run: echo
+"""
+
+ACTION = """name: {name}
+description: Does an example thing.
+runs:
+  using: composite
+  steps:
+    - run: echo
+      shell: bash
+"""
+
+
+@contextlib.contextmanager
+def temp_repository(actions=(), workflows=()):
+    """Create a checkout with the given actions and shared workflows and run inside it."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / ".github/workflows").mkdir(parents=True)
+        for name in workflows:
+            (root / f".github/workflows/{name}.yml").write_text(WORKFLOW.format(name=name))
+        for name in actions:
+            (root / name).mkdir()
+            (root / name / "action.yml").write_text(ACTION.format(name=name))
+        (root / "README.md").write_text("# Example\n")
+        os.chdir(root)
+        try:
+            yield root
+        finally:
+            os.chdir(cwd)
+
+
+def generate(*filenames):
+    """Run the combined entry point in the current directory, as the pre-commit hook does."""
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT), ACTIONS_COMMON_CACHE_DIR=".cache", GITHUB_REPOSITORY="org/repo")
+    subprocess.run([sys.executable, "-m", "scripts", *filenames], env=env, capture_output=True, text=True, check=True)
+
+
+# Test: Changed files map to the action directories and workflow files whose docs depend on them
+def test_affected_files():
+    with temp_repository(actions=["a1", "a2"], workflows=["deploy"]) as root:
+        (root / "a2/EXAMPLES.md").write_text("Examples\n")
+        (root / "nested/a3").mkdir(parents=True)
+        (root / "nested/a3/action.yml").write_text(ACTION.format(name="a3"))
+
+        assert affected_action_dirs(["a1/action.yml", "a2/EXAMPLES.md", "a2/EXAMPLES.md"]) == [Path("a1"), Path("a2")]
+        assert affected_action_dirs(["a1/README.md", "nested/a3/action.yml", "README.md", "gone/action.yml"]) == []
+        assert affected_workflow_files([".github/workflows/deploy.yml", ".github/workflows/gone.yml",
+                                        ".github/workflows/README.md", "deploy.yml"]) == [Path(".github/workflows/deploy.yml")]
+
+
+# Test: Deleting an action or a shared workflow drops it from the generated lists
+def test_deletion_updates_lists():
+    with temp_repository(actions=["a1", "a5"], workflows=["build", "deploy"]) as root:
+        generate()
+        readme = (root / "README.md").read_text()
+        assert "- [a5](a5/README.md)" in readme and "- [deploy]" in readme, readme
+
+        (root / "a5/action.yml").unlink()
+        (root / "a5/README.md").unlink()
+        (root / "a5").rmdir()
+        (root / ".github/workflows/deploy.yml").unlink()
+        generate("a5/action.yml")
+        readme = (root / "README.md").read_text()
+        assert "- [a5](a5/README.md)" not in readme and "- [deploy]" not in readme, readme
+        assert "- [a1](a1/README.md)" in readme and "- [build]" in readme, readme
+
+
+# Test: The scanner prunes excluded and .gitignore'd directories and classifies files in one walk
+def test_scan():
+    with temp_repository(actions=["a1", "a2"], workflows=["deploy"]) as root:
+        (root / "a2/action.yaml").write_text(ACTION.format(name="a2"))
+        (root / "a3").mkdir()
+        (root / "a3/action.yaml").write_text(ACTION.format(name="a3"))
+        (root / ".github/workflows/notes.txt").write_text("")
+        (root / ".github/workflows/other.yaml").write_text("")
+        for ignored in ("node_modules/pkg", ".git/hooks", "build/out", "docs/tmp", "lib/dist",
+                        "deep/x/cache", "sub/generated", "out/kept"):
+            (root / ignored).mkdir(parents=True)
+            (root / ignored / "action.yml").write_text("")
+        (root / "app/dist").mkdir(parents=True)
+        (root / "app/dist/action.yml").write_text("")
+        # A negation re-includes the directory it matches, but not the children of an ignored one.
+        (root / ".gitignore").write_text("# comment\nbuild/\n/docs/tmp\n**/cache\ndist\n!app/dist\nout\n!out/kept\n")
+        (root / "sub/.gitignore").write_text("generated\n")
+        # Anchored to sub/, so it does not apply at the top level.
+        (root / "sub/other").mkdir()
+        (root / "sub/other/action.yml").write_text("")
+        (root / "docs/other").mkdir()
+        (root / "docs/other/action.yml").write_text("")
+
+        result = scan()
+        assert result.action_files == [Path(p) for p in (
+            "a1/action.yml", "a2/action.yml", "a3/action.yaml", "app/dist/action.yml", "docs/other/action.yml",
+            "sub/other/action.yml",
+        )], result.action_files
+        assert result.workflow_files == [Path(".github/workflows/deploy.yml")], result.workflow_files
+        assert result.action_dirs() == [Path("a1"), Path("a2"), Path("a3")], result.action_dirs()
+
+        assert scan(exclude=()).action_files.count(Path(".git/hooks/action.yml")) == 1
+        assert Path("node_modules/pkg/action.yml") in scan(exclude={".git"}).action_files
+
+
+# Test: Splicing all workflow blocks at once gives the same README as updating them one by one
+def test_update_readme_blocks():
+    def block(name, body):
+        return f"## {name} (Workflow)\n\n{MARKER_TEMPLATE.format(name=name)}\n\n{body}\n\n{MARKER_END}"
+
+    existing = (
+        "# Workflows\n\n## build (Workflow)\n\nIntro.\n\n"
+        f"{MARKER_TEMPLATE.format(name='build')}\nold\n{MARKER_END}\n\n"
+        "## deploy (Workflow)\n\nNo docs yet.\n\n"
+        f"{MARKER_TEMPLATE.format(name='unrelated')}\nkept\n{MARKER_END}\n"
+    )
+    blocks = {
+        "build": block("build", r"Matches `\d+\.\d+` in C:\new\path \1 \g<0>"),
+        "deploy": block("deploy", "Deploy inputs"),
+        "release": block("release", "Release inputs"),
+        "lint": block("lint", r"Escaped \\ backslash"),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for start in (existing, None):
+            one_by_one, batched = Path(tmp, "one_by_one.md"), Path(tmp, "batched.md")
+            for path in (one_by_one, batched):
+                if start is None:
+                    path.unlink()
+                else:
+                    path.write_text(start)
+            with contextlib.redirect_stdout(io.StringIO()):
+                for name, content in blocks.items():
+                    update_readme(one_by_one, name, content)
+                update_readme_blocks(batched, blocks)
+            result = batched.read_text()
+            assert result == one_by_one.read_text(), result
+            assert r"C:\new\path \1 \g<0>" in result and r"Escaped \\ backslash" in result, result
+            assert start is None or "kept" in result and "old" not in result, result
+
+
+# Test: The repository is resolved from the git config of checkouts, worktrees and GIT_DIR, unless overridden
+def test_repository_identity():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp).resolve()
+        git_dir = root / "main/.git"
+        (git_dir / "worktrees/wt").mkdir(parents=True)
+        (git_dir / "config").write_text(
+            "[core]\n\tbare = false\n"
+            "# comment\n; comment\n"
+            '[remote "origin"]\n\turl = git@github.com:eidp/old.git\n\tURL = "git@github.com:eidp/actions-common.git"\n'
+            "[remote.Upstream]\n\turl = https://github.com/Other/Repo\n"
+            '[remote "gitlab"] url = https://gitlab.com/a/b.git\n'
+        )
+        (root / "main/sub/dir").mkdir(parents=True)
+        (git_dir / "worktrees/wt/commondir").write_text("../..\n")
+        (root / "wt").mkdir()
+        (root / "wt/.git").write_text("gitdir: ../main/.git/worktrees/wt\n")
+        (root / "module/.git").mkdir(parents=True)
+        (root / "module/.git/config").write_text('[remote "origin"]\n\turl = https://github.com/eidp/module\n')
+        (root / "submodule").mkdir()
+        (root / "submodule/.git").write_text(f"gitdir: {root / 'module/.git'}\n")
+
+        config = read_git_config(git_dir / "config")
+        assert config[("remote", "origin")]["url"] == "git@github.com:eidp/actions-common.git", config
+        assert config[("remote", "upstream")]["url"] == "https://github.com/Other/Repo", config
+        assert config[("remote", "gitlab")]["url"] == "https://gitlab.com/a/b.git", config
+
+        with mock.patch.dict(os.environ, {"GIT_DIR": ""}):
+            assert find_git_dir(root / "main/sub/dir").resolve() == git_dir
+            assert find_git_dir(root / "wt").resolve() == git_dir
+            assert find_git_dir(root / "submodule").resolve() == root / "module/.git"
+            assert repository_from_git(root / "main/sub/dir") == "eidp/actions-common"
+            assert repository_from_git(root / "wt") == "eidp/actions-common"
+            assert repository_from_git(root / "main", remote="upstream") == "Other/Repo"
+            assert repository_from_git(root / "submodule") == "eidp/module"
+            for remote in ("gitlab", "missing"):
+                try:
+                    repository_from_git(root / "main", remote=remote)
+                except ValueError:
+                    continue
+                raise AssertionError(f"Expected remote '{remote}' to be rejected")
+        with mock.patch.dict(os.environ, {"GIT_DIR": str(root / "module/.git")}):
+            assert repository_from_git(root / "main") == "eidp/module"
+
+        variables = {"GIT_DIR": "", "ACTIONS_COMMON_REPOSITORY": "", "GITHUB_REPOSITORY": ""}
+        with mock.patch.dict(os.environ, variables):
+            assert resolve_repository(root / "wt") == "eidp/actions-common"
+            os.environ["GITHUB_REPOSITORY"] = "github/repository"
+            assert resolve_repository(root / "wt") == "github/repository"
+            os.environ["ACTIONS_COMMON_REPOSITORY"] = "explicit/setting"
+            assert resolve_repository(root / "wt") == "explicit/setting"
+            assert resolve_repository(root / "wt", override="explicit/override") == "explicit/override"
+
+
+def main():
+    print("Testing affected files...")
+    test_affected_files()
+
+    print("Testing deletions update the lists...")
+    test_deletion_updates_lists()
+
+    print("Testing the repository scanner...")
+    test_scan()
+
+    print("Testing batched README splicing...")
+    test_update_readme_blocks()
+
+    print("Testing repository identity...")
+    test_repository_identity()
+
+    print("All tests passed.")
+
+if __name__ == "__main__":
+    main()
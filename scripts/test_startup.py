@@ -0,0 +1,106 @@
+# Startup regression tests for the doc generators
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative `python -X importtime` budget for `import scripts`, in microseconds.
+# Importing the package lazily takes about 20 ms; eagerly it took 140 ms.
+IMPORT_BUDGET_US = 75_000
+
+# Only needed to render, parse YAML or run a pool, never to start up.
+HEAVY_MODULES = ("yaml", "py_markdown_table", "concurrent.futures", "importlib.metadata", "tempfile")
+
+WORKFLOW = """name: Example
+on:
+  workflow_call:
+    inputs:
+      target:
+        description: Where to deploy.
+        required: true
+        type: string
+jobs:
+  example:
+    runs-on: ubuntu-latest
+    steps:
+      - run: echo ${{ inputs.target }}
+"""
+
+ACTION = """name: Example action
+description: Does an example thing.
+inputs:
+  value:
+    description: The value.
+    default: "1"
+runs:
+  using: composite
+  steps:
+    - run: echo
+      shell: bash
+"""
+
+
+def run_importtime(args, cwd=REPO_ROOT, env=None):
+    """Run ``python -X importtime`` with ``args``; return stdout and ``{module: cumulative us}``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=cwd,
+        env=dict(os.environ, PYTHONPATH=str(REPO_ROOT), **(env or {})),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imports[name.strip()] = int(cumulative)
+    return result.stdout, imports
+
+
+def heavy_imports(imports):
+    return sorted(name for name in imports if name.split(".")[0] in HEAVY_MODULES or name in HEAVY_MODULES)
+
+
+def test_import_is_lazy():
+    _, imports = run_importtime(["-c", "import scripts"])
+    assert heavy_imports(imports) == [], heavy_imports(imports)
+    assert imports["scripts"] < IMPORT_BUDGET_US, f"import scripts took {imports['scripts']} us"
+
+
+def test_unchanged_run_is_lazy():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / ".github/workflows").mkdir(parents=True)
+        (root / ".github/workflows/example.yml").write_text(WORKFLOW)
+        (root / "example").mkdir()
+        (root / "example/action.yml").write_text(ACTION)
+        (root / "README.md").write_text("# Example\n")
+        env = {"ACTIONS_COMMON_CACHE_DIR": str(root / ".cache"), "GITHUB_REPOSITORY": "org/repo"}
+
+        first = subprocess.run([sys.executable, "-m", "scripts"], cwd=root, capture_output=True, text=True,
+                               env=dict(os.environ, PYTHONPATH=str(REPO_ROOT), **env), check=True)
+        assert "📝 4 file(s) changed" in first.stdout, first.stdout
+        assert "uses: org/repo/example@v0" in (root / "example/README.md").read_text()
+
+        # A second run finds everything up to date, served from the render cache.
+        output, imports = run_importtime(["-m", "scripts"], cwd=root, env=env)
+        assert "📝 0 file(s) changed" in output, output
+        assert heavy_imports(imports) == [], heavy_imports(imports)
+
+
+def main():
+    print("Testing import scripts stays lazy and within budget...")
+    test_import_is_lazy()
+
+    print("Testing an unchanged run imports no renderer...")
+    test_unchanged_run_is_lazy()
+
+    print("All tests passed.")
+
+if __name__ == "__main__":
+    main()
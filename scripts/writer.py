@@ -0,0 +1,53 @@
+import contextlib
+import os
+from pathlib import Path
+
+# Files written and left untouched by write_if_changed() in this process.
+stats = {"changed": 0, "unchanged": 0}
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """
+    Write ``content`` to ``path`` unless the file already holds exactly that.
+
+    Sizes are compared before contents, so most unchanged files cost a stat
+    and one read. Changed files are written to a temporary file next to the
+    target and renamed over it, so readers never see a partial file and an
+    existing file keeps its permissions. Returns whether the file changed.
+    """
+    path = Path(path)
+    data = content.encode("utf-8")
+    try:
+        current = path.stat()
+    except FileNotFoundError:
+        current = None
+    if current is not None and current.st_size == len(data) and path.read_bytes() == data:
+        stats["unchanged"] += 1
+        return False
+
+    # Imported here: runs where nothing changed never write.
+    import tempfile
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        if current is not None:
+            os.chmod(tmp_name, current.st_mode & 0o7777)
+        else:
+            # mkstemp creates files as 0600; use the permissions a plain open() would.
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_name, 0o666 & ~umask)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+    stats["changed"] += 1
+    return True
+
+
+def summary() -> str:
+    """Describe how many files this process changed."""
+    return f"📝 {stats['changed']} file(s) changed, {stats['unchanged']} already up to date."